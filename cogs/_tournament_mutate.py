@@ -0,0 +1,67 @@
+# cogs/_tournament_mutate.py
+# Shared body of the one-field tournament toggle commands
+# (/t_captain_scoring, /t_close_join): guards, defer, read, write,
+# panel refresh and the ephemeral reply all live here once.
+#
+# Not an extension (no setup()); the cogs import it.
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+import discord
+
+from .tournament_db import aget_tournament, aupsert_tournament, update_tournament_field
+from .tournament_admin_panel import panel_debouncer
+
+log = logging.getLogger(__name__)
+
+
+async def apply_mutation(
+    interaction: discord.Interaction,
+    mutate: Callable[[Dict[str, Any]], str],
+    *,
+    field: Optional[str] = None,
+) -> None:
+    """
+    Run `mutate(t)` on this guild's tournament, save it and refresh both panels.
+    Callers keep their @app_commands.checks.has_permissions(manage_guild=True).
+    `mutate` changes `t` in place and returns the text shown after "✅ ".
+    With `field`, only that column is written; otherwise the legacy upsert is used.
+    """
+    guild = interaction.guild
+    if guild is None:
+        await interaction.response.send_message(
+            "❌ This command can only be used in a server.",
+            ephemeral=True,
+        )
+        return
+
+    # Ack first: the DB + panel work below can outlast the 3s interaction window.
+    await interaction.response.defer(ephemeral=True)
+    started = time.perf_counter()
+
+    t = await aget_tournament(guild.id)
+    if not t:
+        await interaction.followup.send(
+            "❌ No active tournament found.",
+            ephemeral=True,
+        )
+        return
+
+    result = mutate(t)
+    if field is not None:
+        await update_tournament_field(guild.id, field, t[field])
+    else:
+        await aupsert_tournament(guild.id, t)
+
+    command = getattr(interaction.command, "name", "?")
+    log.info("Guild %s: /%s -> %s by %s", guild.id, command, result, interaction.user)
+
+    # Admin panel edit is queued (already coalesced); rapid toggles collapse into
+    # one trailing join panel refresh.
+    panel_debouncer.schedule(guild, t)
+
+    log.debug("/%s db=%.0fms", command, (time.perf_counter() - started) * 1000)
+
+    await interaction.followup.send(f"✅ {result}", ephemeral=True)
@@ -4,6 +4,7 @@
 # - safe_create_text_channel
 # - safe_delete_channel
 # - safe_edit_message
+# - safe_fetch_invite / safe_delete_invite
 #
 # Goal:
 # Prevent 429 rate limits + reduce "interaction failed" by pacing bulk operations.
@@ -13,8 +14,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import random
-from typing import Optional, Any
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Any
 
 import discord
 
@@ -23,23 +30,159 @@ import discord
 # pacing / retry core
 # ----------------------------
 
+class RouteLimiter:
+    """
+    Token bucket for one kind of Discord route.
+    Calls go through immediately while tokens remain; once empty, callers wait
+    just long enough for the next token instead of a fixed sleep per call.
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float) -> None:
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller on this route until Discord says the bucket has reset."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_per_sec)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_sec)
+
+    async def __aenter__(self) -> "RouteLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+# Shared across the bot. Roughly Discord's per-route buckets:
+# role create/edit ~1 per 2s sustained, channel create/delete and message edits 5 per 2s.
+LIMITERS: Dict[str, RouteLimiter] = {
+    "roles": RouteLimiter(1, 1 / 2),
+    "channels": RouteLimiter(5, 2.5),
+    "messages.edit": RouteLimiter(5, 2.5),
+}
+
+
 async def _sleep_with_jitter(base: float, jitter: float = 0.15) -> None:
     await asyncio.sleep(max(0.0, base + random.uniform(0, jitter)))
 
 
-async def _handle_rate_limit(exc: Exception, default_sleep: float = 1.5) -> float:
+_MAX_BACKOFF = 30.0
+
+
+def _decorrelated_backoff(base: float, prev: float) -> float:
+    """Decorrelated jitter: spreads parallel retriers apart instead of retrying in lockstep."""
+    return min(_MAX_BACKOFF, random.uniform(base, max(base, prev * 3)))
+
+
+class RetryAdmission:
+    """
+    Global retry budget (token bucket). Every retry after a failed first attempt
+    spends a token; successes earn one back. When Discord is failing broadly the
+    budget runs dry and retries are dropped instead of multiplying the load.
+    First attempts never need a token.
+    """
+
+    def __init__(self, capacity: float = 10, fill_rate: float = 1.0) -> None:
+        self.capacity = capacity
+        self.fill_rate = fill_rate
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.fill_rate)
+        self.last = now
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def refill(self, amount: float = 1) -> None:
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+RETRY_ADMISSION = RetryAdmission()
+
+
+def _header_seconds(headers: Any, name: str) -> Optional[float]:
+    """Seconds to wait from a header holding either delta-seconds or an HTTP-date."""
+    try:
+        raw = headers.get(name)
+    except AttributeError:
+        return None
+    if raw is None:
+        return None
+
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        try:
+            when = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        value = (when - datetime.now(timezone.utc)).total_seconds()
+    return value if value > 0 else None
+
+
+async def _handle_rate_limit(
+    exc: Exception,
+    default_sleep: float = 1.5,
+    limiter: Optional[RouteLimiter] = None,
+) -> float:
     """
     Returns suggested sleep time if exception looks like a Discord 429.
-    discord.py often includes `retry_after` on HTTPException.
+    Uses the longest of discord.py's `retry_after` and the response's Retry-After
+    (seconds or HTTP-date) / X-RateLimit-Reset-After headers: never less than the
+    server asked for.
+    If a route limiter is given it is paused for that long, so other callers on
+    the same route wait it out up front instead of each hitting the 429.
     """
     if isinstance(exc, discord.HTTPException):
         # Some versions expose .status
         status = getattr(exc, "status", None)
         if status == 429:
-            retry_after = getattr(exc, "retry_after", None)
-            if isinstance(retry_after, (int, float)) and retry_after > 0:
-                return float(retry_after) + 0.2
-            return default_sleep
+            headers = getattr(getattr(exc, "response", None), "headers", None)
+            candidates = [
+                getattr(exc, "retry_after", None),
+                _header_seconds(headers, "Retry-After"),
+                _header_seconds(headers, "X-RateLimit-Reset-After"),
+            ]
+            retry_after = max(
+                (float(c) for c in candidates if isinstance(c, (int, float)) and c > 0),
+                default=None,
+            )
+            if retry_after:
+                sleep_for = retry_after + 0.2 + random.uniform(0, 0.5)
+            else:
+                sleep_for = default_sleep
+            if limiter is not None:
+                limiter.pause(sleep_for)
+            return sleep_for
     return 0.0
 
 
@@ -48,13 +191,21 @@ async def _retry_http(
     *,
     tries: int = 5,
     base_sleep: float = 0.8,
-    jitter: float = 0.2,
-    allow_not_found: bool = False
+    allow_not_found: bool = False,
+    route: Optional[str] = None,
 ):
+    limiter = LIMITERS.get(route) if route else None
     last_exc: Optional[Exception] = None
+    delay = base_sleep
     for attempt in range(1, tries + 1):
         try:
-            return await fn()
+            if limiter is not None:
+                async with limiter:
+                    result = await fn()
+            else:
+                result = await fn()
+            RETRY_ADMISSION.refill()
+            return result
         except discord.NotFound:
             if allow_not_found:
                 return None
@@ -64,19 +215,22 @@ async def _retry_http(
             raise
         except discord.HTTPException as e:
             last_exc = e
-            rl_sleep = await _handle_rate_limit(e)
+            rl_sleep = await _handle_rate_limit(e, limiter=limiter)
             if rl_sleep > 0:
+                # 429s are Discord pacing us, not failing: wait it out, no budget spent.
                 await _sleep_with_jitter(rl_sleep, jitter=0.1)
             else:
                 # other transient HTTP issues
-                if attempt == tries:
+                if attempt == tries or not RETRY_ADMISSION.try_acquire():
                     break
-                await _sleep_with_jitter(base_sleep * attempt, jitter=jitter)
+                delay = _decorrelated_backoff(base_sleep, delay)
+                await asyncio.sleep(delay)
         except Exception as e:
             last_exc = e
-            if attempt == tries:
+            if attempt == tries or not RETRY_ADMISSION.try_acquire():
                 break
-            await _sleep_with_jitter(base_sleep * attempt, jitter=jitter)
+            delay = _decorrelated_backoff(base_sleep, delay)
+            await asyncio.sleep(delay)
 
     if last_exc:
         raise last_exc
@@ -87,6 +241,11 @@ async def _retry_http(
 # public helpers
 # ----------------------------
 
+# Each helper hands _retry_http a functools.partial of the API call: the arguments
+# are bound once instead of being re-read through a closure on every attempt.
+_DEFAULT_COLOUR = discord.Colour.default()
+
+
 async def safe_create_role(
     guild: discord.Guild,
     *,
@@ -95,43 +254,42 @@ async def safe_create_role(
     hoist: bool = False,
     mentionable: bool = False,
     reason: Optional[str] = None,
-    position_below: Optional[discord.Role] = None,
-    spacing: float = 0.65,   # pacing between bulk creates
 ) -> discord.Role:
     """
-    Creates a role with retry + pacing.
-    If position_below is provided, attempts to position the role right below it.
-    """
-    async def _do_create():
-        return await guild.create_role(
-            name=name,
-            colour=colour if colour is not None else discord.Colour.default(),
-            hoist=hoist,
-            mentionable=mentionable,
-            reason=reason,
-        )
-
-    role: discord.Role = await _retry_http(_do_create)
-
-    # Optional positioning (another API call; pace it)
-    if position_below is not None:
-        async def _do_edit():
-            # place role right below position_below
-            # discord positions: higher number = lower in list, but edit expects dict mapping role->position
-            try:
-                target_pos = max(1, position_below.position - 1)
-            except Exception:
-                target_pos = role.position
-            return await role.edit(position=target_pos, reason=reason)
+    Creates a role with retry + pacing (LIMITERS["roles"]).
+    Positioning is left to safe_reorder_roles(), so a bulk create can place every
+    role with one extra call instead of one per role.
+    """
+    do_create = functools.partial(
+        guild.create_role,
+        name=name,
+        colour=colour if colour is not None else _DEFAULT_COLOUR,
+        hoist=hoist,
+        mentionable=mentionable,
+        reason=reason,
+    )
+    return await _retry_http(do_create, route="roles")
 
-        try:
-            await _sleep_with_jitter(0.35, jitter=0.1)
-            await _retry_http(_do_edit, tries=3, base_sleep=0.6)
-        except Exception:
-            pass
 
-    await _sleep_with_jitter(spacing, jitter=0.2)
-    return role
+async def safe_reorder_roles(
+    guild: discord.Guild,
+    positions: Dict[discord.Role, int],
+    *,
+    reason: Optional[str] = None,
+) -> bool:
+    """
+    Moves several roles in a single bulk position update.
+    Best effort: returns False if the update still fails after retries.
+    """
+    if not positions:
+        return True
+
+    do_reorder = functools.partial(guild.edit_role_positions, positions=positions, reason=reason)
+    try:
+        await _retry_http(do_reorder, tries=3, base_sleep=0.6, route="roles")
+        return True
+    except Exception:
+        return False
 
 
 async def safe_create_text_channel(
@@ -142,22 +300,19 @@ async def safe_create_text_channel(
     overwrites: Optional[dict[discord.abc.Snowflake, discord.PermissionOverwrite]] = None,
     topic: Optional[str] = None,
     reason: Optional[str] = None,
-    spacing: float = 0.65,
 ) -> discord.TextChannel:
     """
-    Creates a text channel with retry + pacing.
+    Creates a text channel with retry + pacing (LIMITERS["channels"]).
     """
-    async def _do_create():
-        return await guild.create_text_channel(
-            name=name,
-            category=category,
-            overwrites=overwrites,
-            topic=topic,
-            reason=reason,
-        )
-
-    ch: discord.TextChannel = await _retry_http(_do_create)
-    await _sleep_with_jitter(spacing, jitter=0.2)
+    do_create = functools.partial(
+        guild.create_text_channel,
+        name=name,
+        category=category,
+        overwrites=overwrites,
+        topic=topic,
+        reason=reason,
+    )
+    ch: discord.TextChannel = await _retry_http(do_create, route="channels")
     return ch
 
 
@@ -165,36 +320,90 @@ async def safe_delete_channel(
     channel: discord.abc.GuildChannel,
     *,
     reason: Optional[str] = None,
-    spacing: float = 0.55,
 ) -> None:
     """
-    Deletes a channel with retry + pacing.
+    Deletes a channel with retry + pacing (LIMITERS["channels"]).
     allow_not_found=True so cleanup doesn't explode.
     """
-    async def _do_delete():
-        return await channel.delete(reason=reason)
+    do_delete = functools.partial(channel.delete, reason=reason)
+    await _retry_http(do_delete, tries=5, base_sleep=0.8, allow_not_found=True, route="channels")
+
+
+# message.id -> signature of the last content/embed we successfully sent, kept in
+# least-recently-used order and capped (one entry per edited message otherwise).
+_last_edit_sig: "OrderedDict[int, int]" = OrderedDict()
+_LAST_EDIT_SIG_MAX = 1024
+
+# Returned by safe_edit_message() when the edit was skipped as identical; None
+# keeps meaning "message is gone".
+EDIT_SKIPPED: Any = object()
 
-    await _retry_http(_do_delete, tries=5, base_sleep=0.8, allow_not_found=True)
-    await _sleep_with_jitter(spacing, jitter=0.2)
+
+def _edit_signature(kwargs: Dict[str, Any]) -> Optional[int]:
+    # Only plain content/embed edits are comparable; anything else (views, files, ...) always goes out.
+    if set(kwargs) - {"content", "embed"}:
+        return None
+    embed = kwargs.get("embed")
+    embed_dict = embed.to_dict() if embed is not None else None
+    return hash(json.dumps([kwargs.get("content"), embed_dict], sort_keys=True, default=str))
 
 
 async def safe_edit_message(
     message: discord.Message,
-    *,
-    spacing: float = 0.25,
     **kwargs: Any
-) -> Optional[discord.Message]:
+) -> Any:
     """
-    Safe edit for frequently updated embeds (e.g., entry counts, panels).
+    Safe edit for frequently updated embeds (e.g., entry counts, panels), paced by
+    LIMITERS["messages.edit"].
+    Returns the edited message, None if it no longer exists, or EDIT_SKIPPED when
+    the edit is identical to the last one sent for this message.
     """
-    async def _do_edit():
-        return await message.edit(**kwargs)
+    sig = _edit_signature(kwargs)
+    if sig is not None and _last_edit_sig.get(message.id) == sig:
+        _last_edit_sig.move_to_end(message.id)
+        return EDIT_SKIPPED
 
-    edited = await _retry_http(_do_edit, tries=5, base_sleep=0.6, allow_not_found=True)
-    await _sleep_with_jitter(spacing, jitter=0.1)
+    edited = await _retry_http(
+        functools.partial(message.edit, **kwargs), tries=5, base_sleep=0.6, allow_not_found=True, route="messages.edit"
+    )
+    if edited is None:
+        _last_edit_sig.pop(message.id, None)
+    elif sig is not None:
+        _last_edit_sig[message.id] = sig
+        _last_edit_sig.move_to_end(message.id)
+        if len(_last_edit_sig) > _LAST_EDIT_SIG_MAX:
+            _last_edit_sig.popitem(last=False)
     return edited
 
 
+async def safe_fetch_invite(
+    client: discord.Client,
+    code: str,
+    *,
+    tries: int = 3,
+) -> Optional[discord.Invite]:
+    """
+    Fetch an invite, waiting out 429s (retry_after) between tries.
+    Returns None if the invite no longer exists.
+    """
+    do_fetch = functools.partial(client.fetch_invite, code)
+    return await _retry_http(do_fetch, tries=tries, base_sleep=0.6, allow_not_found=True)
+
+
+async def safe_delete_invite(
+    invite: discord.Invite,
+    *,
+    reason: Optional[str] = None,
+    tries: int = 3,
+) -> None:
+    """
+    Delete an invite, waiting out 429s (retry_after) between tries.
+    An invite that is already gone counts as deleted.
+    """
+    do_delete = functools.partial(invite.delete, reason=reason)
+    await _retry_http(do_delete, tries=tries, base_sleep=0.6, allow_not_found=True)
+
+
 async def setup(bot):
     """discord.py extension entrypoint (no-op)."""
     return
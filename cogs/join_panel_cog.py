@@ -1,7 +1,9 @@
 # cogs/join_panel_cog.py
+import asyncio
 import logging
 import sqlite3
-from typing import Optional, Dict, Any
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
 
 import discord
 from discord import app_commands
@@ -10,25 +12,76 @@ from discord.ui import View, button
 
 log = logging.getLogger(__name__)
 
-# Centralized paths / .env loader
-from core.config import DB_PATH
+# Shared per-thread connection (WAL + PRAGMAs applied once) instead of a fresh
+# sqlite3.connect() per button click.
+from core.db import run_db, with_conn
+
+from .discord_safe import EDIT_SKIPPED, safe_edit_message
+from .tournament_db import invalidate_tournament, link_tournament_cache
 
 
 # ---------- Small DB Helpers ----------
 
+# Hot statements as module constants: the shared connection's sqlite3 statement
+# cache is keyed by SQL text, so each one is compiled once per connection and
+# reused on every click.
+_SQL_GET_TOURNAMENT = "SELECT * FROM tournaments WHERE guild_id = ?"
+_SQL_SET_PANEL_WITH_INVITE = """
+    UPDATE tournaments
+    SET join_panel_channel_id = ?, join_panel_message_id = ?, join_invite_code = ?
+    WHERE guild_id = ?
+"""
+_SQL_SET_PANEL = """
+    UPDATE tournaments
+    SET join_panel_channel_id = ?, join_panel_message_id = ?
+    WHERE guild_id = ?
+"""
+_SQL_ADJUST_COUNTS = """
+    UPDATE tournaments
+    SET players_joined = MAX(0, players_joined + ?),
+        spectators_joined = MAX(0, spectators_joined + ?)
+    WHERE guild_id = ?
+"""
+
+
+# Rows read by the buttons, keyed by guild_id, so a click normally does no SELECT.
+# Linked to tournament_db's cache: the invalidate_tournament()/patch_cached_tournament()
+# calls made on open/close/edit/delete reach these rows too.
+_tournament_cache: Dict[int, Dict[str, Any]] = {}
+link_tournament_cache(_tournament_cache)
+
+
+@with_conn
+def _load_tournament(conn: sqlite3.Connection, guild_id: int) -> Optional[Dict[str, Any]]:
+    row = conn.execute(_SQL_GET_TOURNAMENT, (guild_id,)).fetchone()
+    return dict(row) if row else None
+
+
 def get_tournament(guild_id: int) -> Optional[Dict[str, Any]]:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM tournaments WHERE guild_id = ?", (guild_id,))
-    row = cur.fetchone()
-    conn.close()
-    if not row:
-        return None
-    return dict(row)
+    row = _tournament_cache.get(guild_id)
+    if row is None:
+        row = _load_tournament(guild_id)
+        if row is None:
+            return None
+        _tournament_cache[guild_id] = row
+
+    return _overlay_pending(dict(row), guild_id)
+
+
+def _overlay_pending(t: Dict[str, Any], guild_id: int) -> Dict[str, Any]:
+    """Derived fields + count deltas that haven't been flushed yet."""
+    t["max_players"] = (t.get("max_teams") or 0) * (t.get("team_size") or 0)
 
+    pending = _pending_counts.get(guild_id)
+    if pending:
+        t["players_joined"] = max(0, (t.get("players_joined") or 0) + pending[0])
+        t["spectators_joined"] = max(0, (t.get("spectators_joined") or 0) + pending[1])
+    return t
 
+
+@with_conn
 def set_join_panel_message(
+    conn: sqlite3.Connection,
     guild_id: int,
     channel_id: int,
     message_id: int,
@@ -38,61 +91,112 @@ def set_join_panel_message(
     Save where the join panel lives + (optionally) the invite code used for that channel.
     Requires a 'join_invite_code' column in the tournaments table.
     """
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-
-    if invite_code is not None:
-        cur.execute(
-            """
-            UPDATE tournaments
-            SET join_panel_channel_id = ?, join_panel_message_id = ?, join_invite_code = ?
-            WHERE guild_id = ?
-            """,
-            (channel_id, message_id, invite_code, guild_id),
-        )
-    else:
-        cur.execute(
-            """
-            UPDATE tournaments
-            SET join_panel_channel_id = ?, join_panel_message_id = ?
-            WHERE guild_id = ?
-            """,
-            (channel_id, message_id, guild_id),
-        )
+    def _write():
+        if invite_code is not None:
+            conn.execute(_SQL_SET_PANEL_WITH_INVITE, (channel_id, message_id, invite_code, guild_id))
+        else:
+            conn.execute(_SQL_SET_PANEL, (channel_id, message_id, guild_id))
+        conn.commit()
+
+    run_db(_write)
+    invalidate_tournament(guild_id)
+
 
-    conn.commit()
-    conn.close()
+# Count deltas are buffered per guild and written in one transaction, so a join
+# flood costs one COMMIT per batch instead of one per click.
+_COUNTS_FLUSH_DELAY = 0.5
+_COUNTS_FLUSH_MAX_OPS = 32
+_pending_counts: Dict[int, List[int]] = {}  # guild_id -> [player_delta, spectator_delta]
+_pending_ops = 0
+_counts_flush_task: Optional[asyncio.Task] = None
 
 
 def adjust_counts(guild_id: int, player_delta: int = 0, spectator_delta: int = 0) -> None:
     """Adjust cached player/spectator counts for the tournament in this guild."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # <-- make rows dict-like
-    cur = conn.cursor()
+    global _pending_ops, _counts_flush_task
 
-    cur.execute(
-        "SELECT players_joined, spectators_joined FROM tournaments WHERE guild_id = ?",
-        (guild_id,),
-    )
-    row = cur.fetchone()
-    if not row:
-        conn.close()
+    pending = _pending_counts.setdefault(guild_id, [0, 0])
+    pending[0] += player_delta
+    pending[1] += spectator_delta
+    _pending_ops += 1
+
+    if _pending_ops >= _COUNTS_FLUSH_MAX_OPS:
+        flush_counts()
+    elif _counts_flush_task is None:
+        _counts_flush_task = asyncio.create_task(_flush_counts_soon())
+
+
+async def _flush_counts_soon() -> None:
+    global _counts_flush_task
+    try:
+        await asyncio.sleep(_COUNTS_FLUSH_DELAY)
+    finally:
+        _counts_flush_task = None
+    try:
+        flush_counts()
+    except Exception as e:
+        log.exception("Failed to flush join counts: %r", e)
+
+
+@with_conn
+def flush_counts(conn: sqlite3.Connection) -> None:
+    """Write all buffered count deltas (one atomic UPDATE per guild, one COMMIT)."""
+    global _pending_ops
+
+    batch = [(pd, sd, gid) for gid, (pd, sd) in _pending_counts.items() if pd or sd]
+    _pending_counts.clear()
+    _pending_ops = 0
+    if not batch:
         return
 
-    players = max(0, row["players_joined"] + player_delta)
-    spectators = max(0, row["spectators_joined"] + spectator_delta)
+    def _write():
+        conn.executemany(_SQL_ADJUST_COUNTS, batch)
+        conn.commit()
 
-    cur.execute(
-        "UPDATE tournaments SET players_joined = ?, spectators_joined = ? WHERE guild_id = ?",
-        (players, spectators, guild_id),
-    )
-    conn.commit()
-    conn.close()
+    try:
+        run_db(_write)
+    except Exception:
+        # Put the deltas back so the next flush retries them.
+        for pd, sd, gid in batch:
+            pending = _pending_counts.setdefault(gid, [0, 0])
+            pending[0] += pd
+            pending[1] += sd
+        raise
+    for _, _, gid in batch:
+        invalidate_tournament(gid)
 
 
 # ---------- Join Panel Embed Builder + Refresher ----------
 
-def build_join_embed(guild: discord.Guild, t: Dict[str, Any]) -> discord.Embed:
+# (tournament column, fixed fallback name) for the channels the join panel links to.
+_JOIN_CHANNELS = (
+    ("create_team_channel_id", "🏷│create-team"),
+    ("chat_channel_id", "💬│tournament-chat"),
+    ("rules_channel_id", "📜│tournament-rules"),
+)
+
+
+def resolve_join_channels(
+    guild: discord.Guild,
+    t: Dict[str, Any],
+) -> Tuple[Optional[discord.TextChannel], Optional[discord.TextChannel], Optional[discord.TextChannel]]:
+    """
+    (create-team, chat, rules) channels: O(1) lookups by the ids stored on the
+    tournament; tournaments created before those ids were saved fall back to one
+    name scan over the guild's text channels.
+    """
+    found = [guild.get_channel(t.get(key) or 0) for key, _ in _JOIN_CHANNELS]
+    if None in found:
+        by_name = {ch.name: ch for ch in guild.text_channels}
+        found = [ch or by_name.get(name) for ch, (_, name) in zip(found, _JOIN_CHANNELS)]
+    return tuple(found)  # type: ignore[return-value]
+
+
+def build_join_embed(
+    guild: discord.Guild,
+    t: Dict[str, Any],
+    channels: Optional[Tuple[Optional[discord.TextChannel], ...]] = None,
+) -> discord.Embed:
     name = t["name"]
     max_teams = t["max_teams"]
     teams_joined = t.get("teams_joined", 0)
@@ -101,10 +205,7 @@ def build_join_embed(guild: discord.Guild, t: Dict[str, Any]) -> discord.Embed:
     team_size = t["team_size"]
     queue_status = t["queue_status"]
 
-    # Find channels by their fixed names
-    create_team_ch = discord.utils.get(guild.text_channels, name="🏷│create-team")
-    chat_ch = discord.utils.get(guild.text_channels, name="💬│tournament-chat")
-    rules_ch = discord.utils.get(guild.text_channels, name="📜│tournament-rules")
+    create_team_ch, chat_ch, rules_ch = channels or resolve_join_channels(guild, t)
 
     ct_mention = create_team_ch.mention if create_team_ch else "`#create-team`"
     chat_mention = chat_ch.mention if chat_ch else "`#tournament-chat`"
@@ -143,15 +244,20 @@ def build_join_embed(guild: discord.Guild, t: Dict[str, Any]) -> discord.Embed:
     return embed
 
 
-async def refresh_join_panel_message(guild: discord.Guild) -> None:
+# Last embed dict shown per join panel message id.
+_LAST_JOIN_EMBED: Dict[int, Dict[str, Any]] = {}
+
+
+async def refresh_join_panel_message(guild: discord.Guild, t: Optional[Dict[str, Any]] = None) -> None:
     """
     Used by BOTH this cog and the tournament admin panel to keep the
     join panel embed in sync (status, counts, etc).
+    Callers that already hold the tournament dict pass it as `t` to skip the re-read.
     """
     if guild is None:
         return
 
-    t = get_tournament(guild.id)
+    t = get_tournament(guild.id) if t is None else _overlay_pending(dict(t), guild.id)
     if not t:
         return
 
@@ -164,18 +270,75 @@ async def refresh_join_panel_message(guild: discord.Guild) -> None:
     if not isinstance(channel, discord.TextChannel):
         return
 
-    try:
-        msg = await channel.fetch_message(message_id)
-    except discord.NotFound:
+    embed = build_join_embed(guild, t)
+    new_d = embed.to_dict()
+
+    # Nothing changed since our last edit: no API call at all.
+    if _LAST_JOIN_EMBED.get(message_id) == new_d:
         return
 
-    embed = build_join_embed(guild, t)
+    # PartialMessage edits the same route without a GET for the full message first.
+    msg = channel.get_partial_message(message_id)
     view = JoinTournamentView()
-    await msg.edit(embed=embed, view=view)
+    edited = await safe_edit_message(msg, embed=embed, view=view)
+    if edited is None:
+        # Panel message was deleted.
+        _LAST_JOIN_EMBED.pop(message_id, None)
+        return
+    if edited is EDIT_SKIPPED:
+        return
+    _LAST_JOIN_EMBED[message_id] = new_d
+
+
+# Button clicks don't edit the panel themselves: they schedule one refresh per guild
+# that runs after a short delay, so a join flood becomes a handful of edits.
+_JOIN_REFRESH_DELAY = 1.5
+_refresh_tasks: Dict[int, asyncio.Task] = {}
+
+
+def schedule_join_panel_refresh(guild: discord.Guild) -> None:
+    """Coalesce join panel refreshes for this guild into one delayed edit."""
+    if guild is None or guild.id in _refresh_tasks:
+        return
+    _refresh_tasks[guild.id] = asyncio.create_task(_delayed_refresh(guild))
+
+
+async def _delayed_refresh(guild: discord.Guild) -> None:
+    try:
+        await asyncio.sleep(_JOIN_REFRESH_DELAY)
+    finally:
+        # Clicks after this point schedule a new refresh that sees their counts.
+        _refresh_tasks.pop(guild.id, None)
+
+    try:
+        await refresh_join_panel_message(guild)
+    except Exception as e:
+        log.exception("Guild %s: Failed to refresh join panel: %r", guild.id, e)
 
 
 # ---------- Join Panel View ----------
 
+# One lock per (guild_id, user_id): a double click or a client retry waits for the
+# click before it and then sees its role change, so counts are applied once. Entries
+# go away with the last click holding them.
+_click_locks: "weakref.WeakValueDictionary[Tuple[int, int], asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _click_lock(guild_id: int, user_id: int) -> asyncio.Lock:
+    lock = _click_locks.get((guild_id, user_id))
+    if lock is None:
+        lock = _click_locks[(guild_id, user_id)] = asyncio.Lock()
+    return lock
+
+
+async def _refetch_member(guild: discord.Guild, member: discord.Member) -> discord.Member:
+    """The member in a queued click predates the roles the previous click changed."""
+    try:
+        return await guild.fetch_member(member.id)
+    except discord.HTTPException:
+        return guild.get_member(member.id) or member
+
+
 class JoinTournamentView(View):
     """
     View attached to the public 'Join Tournament' message.
@@ -227,60 +390,72 @@ class JoinTournamentView(View):
             return
 
         member = interaction.user
-
-        # Already a player?
-        if player_role in member.roles:
-            await interaction.response.send_message(
-                "✅ You’re already joined as a **Player** in this tournament.",
-                ephemeral=True,
-            )
-            return
-
-        # Capacity check (max players = max_teams * team_size)
-        max_players = t["max_teams"] * t["team_size"]
-        current_players = t.get("players_joined", 0)
-        if current_players >= max_players:
-            await interaction.response.send_message(
-                "⚠ Player spots are currently **full**. You can still join as a **Spectator**.",
-                ephemeral=True,
-            )
-            return
-
-        # Track whether they were a spectator BEFORE we touch roles
-        had_spectator = bool(spectator_role and (spectator_role in member.roles))
-
-        # Apply roles: remove spectator if they had it, then add player
-        roles_to_add = []
-        roles_to_remove = []
-        if had_spectator:
-            roles_to_remove.append(spectator_role)
-        roles_to_add.append(player_role)
-
-        try:
-            if roles_to_remove:
-                await member.remove_roles(*roles_to_remove, reason="Switching to Tournament Player")
-            await member.add_roles(*roles_to_add, reason="Joined tournament as Player")
-        except discord.Forbidden:
-            await interaction.response.send_message(
-                "⚠ I don't have permission to manage your roles.",
-                ephemeral=True,
+        lock = _click_lock(guild.id, member.id)
+        waited = lock.locked()
+        async with lock:
+            if waited:
+                member = await _refetch_member(guild, member)
+
+            # Already a player?
+            if member.get_role(player_role.id):
+                await interaction.response.send_message(
+                    "✅ You’re already joined as a **Player** in this tournament.",
+                    ephemeral=True,
+                )
+                return
+
+            # Capacity check (max players = max_teams * team_size)
+            if t.get("players_joined", 0) >= t["max_players"]:
+                await interaction.response.send_message(
+                    "⚠ Player spots are currently **full**. You can still join as a **Spectator**.",
+                    ephemeral=True,
+                )
+                return
+
+            # Track whether they were a spectator BEFORE we touch roles
+            had_spectator = bool(spectator_role and member.get_role(spectator_role.id))
+
+            # Apply roles: swap spectator -> player in one member PATCH
+            # (remove_roles + add_roles would be two requests on the member bucket);
+            # a lone add stays an add_roles, which can't undo anyone else's change.
+            try:
+                if had_spectator:
+                    new_roles = [
+                        r for r in member.roles
+                        if not r.is_default() and r.id != spectator_role.id
+                    ]
+                    new_roles.append(player_role)
+                    updated = await member.edit(roles=new_roles, reason="Joined tournament as Player")
+                    # edit() returns the member from the API response: only count a
+                    # swap that actually landed.
+                    if updated is not None and player_role not in updated.roles:
+                        log.warning("Guild %s: player role not applied to %s", guild.id, member.id)
+                        await interaction.response.send_message(
+                            "⚠ Couldn't apply the Player role – please try again.",
+                            ephemeral=True,
+                        )
+                        return
+                else:
+                    await member.add_roles(player_role, reason="Joined tournament as Player")
+            except discord.Forbidden:
+                await interaction.response.send_message(
+                    "⚠ I don't have permission to manage your roles.",
+                    ephemeral=True,
+                )
+                return
+
+            # Update counts: +1 player, -1 spectator if they had spectator before
+            adjust_counts(
+                guild.id,
+                player_delta=1,
+                spectator_delta=(-1 if had_spectator else 0),
             )
-            return
-
-        # Update counts: +1 player, -1 spectator if they had spectator before
-        adjust_counts(
-            guild.id,
-            player_delta=1,
-            spectator_delta=(-1 if had_spectator else 0),
-        )
 
         # Refresh embed (players count / status)
-        await refresh_join_panel_message(guild)
+        schedule_join_panel_refresh(guild)
 
         # Mention channels
-        create_team_ch = discord.utils.get(guild.text_channels, name="🏷│create-team")
-        chat_ch = discord.utils.get(guild.text_channels, name="💬│tournament-chat")
-        rules_ch = discord.utils.get(guild.text_channels, name="📜│tournament-rules")
+        create_team_ch, chat_ch, rules_ch = resolve_join_channels(guild, t)
 
         ct_mention = create_team_ch.mention if create_team_ch else "`#create-team`"
         chat_mention = chat_ch.mention if chat_ch else "`#tournament-chat`"
@@ -328,41 +503,45 @@ class JoinTournamentView(View):
             return
 
         member = interaction.user
-
-        # Already a player?
-        if player_role and player_role in member.roles:
-            await interaction.response.send_message(
-                "⚠ You’re currently a **Player** in this tournament.\n"
-                "If you want to spectate instead, leave the tournament first and then choose **Spectate Only**.",
-                ephemeral=True,
-            )
-            return
-
-        # Already a spectator?
-        if spectator_role in member.roles:
-            await interaction.response.send_message(
-                "✅ You’re already a **Spectator** for this tournament.",
-                ephemeral=True,
-            )
-            return
-
-        try:
-            await member.add_roles(spectator_role, reason="Joined tournament as Spectator")
-        except discord.Forbidden:
-            await interaction.response.send_message(
-                "⚠ I don't have permission to manage your roles.",
-                ephemeral=True,
-            )
-            return
-
-        # Update counts
-        adjust_counts(guild.id, player_delta=0, spectator_delta=1)
+        lock = _click_lock(guild.id, member.id)
+        waited = lock.locked()
+        async with lock:
+            if waited:
+                member = await _refetch_member(guild, member)
+
+            # Already a player?
+            if player_role and member.get_role(player_role.id):
+                await interaction.response.send_message(
+                    "⚠ You’re currently a **Player** in this tournament.\n"
+                    "If you want to spectate instead, leave the tournament first and then choose **Spectate Only**.",
+                    ephemeral=True,
+                )
+                return
+
+            # Already a spectator?
+            if member.get_role(spectator_role.id):
+                await interaction.response.send_message(
+                    "✅ You’re already a **Spectator** for this tournament.",
+                    ephemeral=True,
+                )
+                return
+
+            try:
+                await member.add_roles(spectator_role, reason="Joined tournament as Spectator")
+            except discord.Forbidden:
+                await interaction.response.send_message(
+                    "⚠ I don't have permission to manage your roles.",
+                    ephemeral=True,
+                )
+                return
+
+            # Update counts
+            adjust_counts(guild.id, player_delta=0, spectator_delta=1)
 
         # Refresh embed
-        await refresh_join_panel_message(guild)
+        schedule_join_panel_refresh(guild)
 
-        chat_ch = discord.utils.get(guild.text_channels, name="💬│tournament-chat")
-        rules_ch = discord.utils.get(guild.text_channels, name="📜│tournament-rules")
+        _, chat_ch, rules_ch = resolve_join_channels(guild, t)
 
         chat_mention = chat_ch.mention if chat_ch else "`#tournament-chat`"
         rules_mention = rules_ch.mention if rules_ch else "`#tournament-rules`"
@@ -400,42 +579,56 @@ class JoinTournamentView(View):
         spectator_role = guild.get_role(t.get("spectator_role_id") or 0)
 
         member = interaction.user
-
-        had_player = player_role in member.roles if player_role else False
-        had_spectator = spectator_role in member.roles if spectator_role else False
-
-        if not had_player and not had_spectator:
-            await interaction.response.send_message(
-                "ℹ You are not currently joined in this tournament as a player or spectator.",
-                ephemeral=True,
-            )
-            return
-
-        roles_to_remove = []
-        if had_player:
-            roles_to_remove.append(player_role)
-        if had_spectator:
-            roles_to_remove.append(spectator_role)
-
-        try:
-            if roles_to_remove:
-                await member.remove_roles(*roles_to_remove, reason="Left tournament")
-        except discord.Forbidden:
-            await interaction.response.send_message(
-                "⚠ I don't have permission to manage your roles.",
-                ephemeral=True,
+        lock = _click_lock(guild.id, member.id)
+        waited = lock.locked()
+        async with lock:
+            if waited:
+                member = await _refetch_member(guild, member)
+
+            had_player = bool(player_role and member.get_role(player_role.id))
+            had_spectator = bool(spectator_role and member.get_role(spectator_role.id))
+
+            if not had_player and not had_spectator:
+                await interaction.response.send_message(
+                    "ℹ You are not currently joined in this tournament as a player or spectator.",
+                    ephemeral=True,
+                )
+                return
+
+            roles_to_remove = []
+            if had_player:
+                roles_to_remove.append(player_role)
+            if had_spectator:
+                roles_to_remove.append(spectator_role)
+
+            try:
+                if len(roles_to_remove) == 1:
+                    await member.remove_roles(roles_to_remove[0], reason="Left tournament")
+                else:
+                    # Both roles: one member PATCH instead of one request per role.
+                    # Rewriting the role list can undo a concurrent change to another
+                    # role, so it's only used where it saves a call.
+                    remove_ids = {r.id for r in roles_to_remove}
+                    await member.edit(
+                        roles=[r for r in member.roles if not r.is_default() and r.id not in remove_ids],
+                        reason="Left tournament",
+                    )
+            except discord.Forbidden:
+                await interaction.response.send_message(
+                    "⚠ I don't have permission to manage your roles.",
+                    ephemeral=True,
+                )
+                return
+
+            # Update counts
+            adjust_counts(
+                guild.id,
+                player_delta=(-1 if had_player else 0),
+                spectator_delta=(-1 if had_spectator else 0),
             )
-            return
-
-        # Update counts
-        adjust_counts(
-            guild.id,
-            player_delta=(-1 if had_player else 0),
-            spectator_delta=(-1 if had_spectator else 0),
-        )
 
         # Refresh embed
-        await refresh_join_panel_message(guild)
+        schedule_join_panel_refresh(guild)
 
         await interaction.response.send_message(
             f"🚪 You have **left** the tournament **{t['name']}**.\n"
@@ -455,6 +648,13 @@ class JoinPanelCog(commands.Cog):
         # Persistent view so the buttons keep working after bot restarts
         self.bot.add_view(JoinTournamentView())
 
+    async def cog_unload(self):
+        global _counts_flush_task
+        if _counts_flush_task is not None:
+            _counts_flush_task.cancel()
+            _counts_flush_task = None
+        flush_counts()
+
     # Helper: make sure command is only used in the admin panel channel
     def _ensure_admin_channel(self, interaction: discord.Interaction) -> Optional[str]:
         guild = interaction.guild
@@ -1,15 +1,20 @@
 import logging
+from typing import Any, Dict
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from .tournament_db import get_tournament, upsert_tournament
-from .tournament_admin_panel import update_panel_message, refresh_join_panel_message
+from ._tournament_mutate import apply_mutation
 
 log = logging.getLogger(__name__)
 
 
+def _close_queue(t: Dict[str, Any]) -> str:
+    t["queue_status"] = "CLOSED"
+    return "Join is now **CLOSED**."
+
+
 class TournamentCloseJoinCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -21,33 +26,7 @@ class TournamentCloseJoinCog(commands.Cog):
     )
     @app_commands.checks.has_permissions(manage_guild=True)
     async def t_close_join(self, interaction: discord.Interaction):
-        guild = interaction.guild
-        if guild is None:
-            await interaction.response.send_message(
-                "❌ This command can only be used in a server.",
-                ephemeral=True,
-            )
-            return
-
-        t = get_tournament(guild.id)
-        if not t:
-            await interaction.response.send_message(
-                "❌ No active tournament found.",
-                ephemeral=True,
-            )
-            return
-
-        t["queue_status"] = "CLOSED"
-        upsert_tournament(guild.id, t)
-        log.info("Guild %s: Queue closed by %s", guild.id, interaction.user)
-
-        await update_panel_message(guild, t)
-        await refresh_join_panel_message(guild)
-
-        await interaction.response.send_message(
-            "✅ Join is now **CLOSED**.",
-            ephemeral=True,
-        )
+        await apply_mutation(interaction, _close_queue, field="queue_status")
 
 
 async def setup(bot: commands.Bot):
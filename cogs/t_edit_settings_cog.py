@@ -1,10 +1,11 @@
+import asyncio
 import logging
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from .tournament_db import get_tournament
+from .tournament_db import aget_tournament
 from .tournament_admin_panel import EditTournamentModal
 
 log = logging.getLogger(__name__)
@@ -29,7 +30,17 @@ class TournamentEditSettingsCog(commands.Cog):
             )
             return
 
-        t = get_tournament(guild.id)
+        # A modal can't be deferred, so the read must finish well inside Discord's
+        # 3s ack window (cache hits return immediately).
+        try:
+            t = await asyncio.wait_for(aget_tournament(guild.id), timeout=1.5)
+        except asyncio.TimeoutError:
+            await interaction.response.send_message(
+                "⏳ The database is busy right now. Please retry in a moment.",
+                ephemeral=True,
+            )
+            return
+
         if not t:
             await interaction.response.send_message(
                 "❌ No active tournament found.",
@@ -4,19 +4,20 @@ import io
 import asyncio
 import logging
 import math
-from typing import List, Optional, Dict, Any
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import Modal, TextInput, View, button
 
+from core.db import get_pooled_connection, run_db
+
 from .tournament_db import (
     get_tournament,
     upsert_tournament,
     get_ready_teams,
     clear_bracket,
-    insert_bracket_match,
     update_bracket_match,
     get_db_connection,
 )
@@ -42,6 +43,62 @@ async def _delete_channel_later(channel: discord.abc.GuildChannel, delay: int =
         )
 
 
+# -------------------------------------------------------------------
+# helpers: match rows (one read before a round, one batched write after it)
+# -------------------------------------------------------------------
+
+_SQL_MAX_MATCH_ID = "SELECT COALESCE(MAX(match_id), 0) FROM bracket_matches WHERE guild_id = ?"
+_SQL_INSERT_MATCH = """
+    INSERT INTO bracket_matches
+    (guild_id, match_id, round_number, team_a, team_b, winner, status, channel_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_CURRENT_ROUND_MATCHES = """
+    SELECT match_id, round_number, team_a, team_b, winner, status
+    FROM bracket_matches
+    WHERE guild_id = ?
+      AND round_number = (SELECT MAX(round_number) FROM bracket_matches WHERE guild_id = ?)
+    ORDER BY match_id ASC
+"""
+_SQL_COUNT_ROUND_MATCHES = """
+    SELECT COUNT(*) FROM bracket_matches
+    WHERE guild_id = ? AND round_number = ?
+"""
+
+
+def _max_match_id(guild_id: int) -> int:
+    with get_pooled_connection() as conn:
+        return conn.execute(_SQL_MAX_MATCH_ID, (guild_id,)).fetchone()[0] or 0
+
+
+def _insert_match_rows(rows: List[tuple]) -> None:
+    """Insert a whole round's matches in one transaction."""
+    if not rows:
+        return
+    with get_pooled_connection() as conn:
+        def _write():
+            with conn:
+                conn.executemany(_SQL_INSERT_MATCH, rows)
+
+        run_db(_write)
+
+
+# -------------------------------------------------------------------
+# helper: find the results / bracket channels by name
+# -------------------------------------------------------------------
+
+_NAMED_CHANNELS = {
+    "results": lambda c: "match-results" in c.name,
+    "bracket": lambda c: "bracket-and-scores" in c.name or "bracket" in c.name,
+}
+
+
+def _find_named_channel(guild: discord.Guild, kind: str) -> Optional[discord.TextChannel]:
+    """Linear scan over the guild's text channels (see the cog's cached resolver)."""
+    return discord.utils.find(_NAMED_CHANNELS[kind], guild.text_channels)
+
+
 # -------------------------------------------------------------------
 # SCORE MODAL + BUTTON
 # -------------------------------------------------------------------
@@ -131,61 +188,50 @@ class ScoreMatchModal(Modal):
 
         await interaction.response.send_message(embed=result_embed)
 
-        # 4) mirror result into match-results + bracket-and-scores channels
+        # 4) mirror result into match-results + bracket-and-scores channels and
+        # 5) post the cleanup notice: independent sends, so they go out together.
+        sends = []  # (what, coroutine)
+        cog = interaction.client.get_cog("TournamentStartBracketCog")
         if guild is not None:
-            # match-results
-            results_ch = discord.utils.find(
-                lambda c: isinstance(c, discord.TextChannel)
-                and "match-results" in c.name,
-                guild.text_channels,
-            )
+            resolve = cog.resolve_named_channel if cog is not None else _find_named_channel
+            results_ch = resolve(guild, "results")
             if results_ch:
-                try:
-                    await results_ch.send(embed=result_embed)
-                except Exception as e:
-                    log.warning(
-                        "Failed to send result to match-results in guild %s: %r",
-                        guild.id,
-                        e,
-                    )
+                sends.append(("match-results", results_ch.send(embed=result_embed)))
 
-            # bracket-and-scores
-            bracket_ch = discord.utils.find(
-                lambda c: isinstance(c, discord.TextChannel)
-                and ("bracket-and-scores" in c.name or "bracket" in c.name),
-                guild.text_channels,
-            )
+            bracket_ch = resolve(guild, "bracket")
             if bracket_ch:
-                try:
-                    await bracket_ch.send(
+                sends.append((
+                    "bracket channel",
+                    bracket_ch.send(
                         f"📊 **Match {self.match_id} Result:** "
                         f"**{self.team_a}** {s_a} – {s_b} **{self.team_b}** "
                         f"(winner: **{winner}**)"
-                    )
-                except Exception as e:
-                    log.warning(
-                        "Failed to send result to bracket channel in guild %s: %r",
-                        guild.id,
-                        e,
-                    )
-
-        # 5) clean up match channel
-        if isinstance(channel, discord.TextChannel):
-            try:
-                await channel.send(
-                    "✅ Match scored. This channel will be deleted in **5 seconds**."
-                )
-                asyncio.create_task(_delete_channel_later(channel, 5))
-            except Exception as e:
+                    ),
+                ))
+
+        is_match_channel = isinstance(channel, discord.TextChannel)
+        if is_match_channel:
+            sends.append((
+                "deletion notice",
+                channel.send("✅ Match scored. This channel will be deleted in **5 seconds**."),
+            ))
+
+        results = await asyncio.gather(*(coro for _, coro in sends), return_exceptions=True)
+        for (what, _), result in zip(sends, results):
+            if isinstance(result, Exception):
                 log.warning(
-                    "Failed to schedule deletion message for channel %s: %r",
-                    channel.id if channel else "?",
-                    e,
+                    "Failed to send %s for match %s in guild %s: %r",
+                    what,
+                    self.match_id,
+                    self.guild_id,
+                    result,
                 )
 
+        if is_match_channel:
+            asyncio.create_task(_delete_channel_later(channel, 5))
+
         # 6) tell the main cog to progress bracket / create next round / update image
         if guild is not None:
-            cog = interaction.client.get_cog("TournamentStartBracketCog")
             if cog is not None:
                 try:
                     await cog.after_match_scored(guild)
@@ -239,8 +285,38 @@ class TournamentStartBracketCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # guild_id -> {"results"/"bracket": channel_id} found by name scan
+        self._chan_cache: Dict[int, Dict[str, int]] = {}
+        # guild_id -> id of the bracket image message we last posted. In memory only:
+        # the tournaments table has no column for it, so after a restart the first
+        # redraw finds the old image by scanning history once.
+        self._bracket_msg_ids: Dict[int, int] = {}
+        # guild_id -> hash of the PNG in that message (identical redraws are skipped)
+        self._bracket_png_sig: Dict[int, int] = {}
         log.info("TournamentStartBracketCog loaded.")
 
+    # ---------------- CHANNEL LOOKUP -----------------
+
+    def resolve_named_channel(self, guild: discord.Guild, kind: str) -> Optional[discord.TextChannel]:
+        """O(1) get_channel() for a channel found by name before; scans only on a miss."""
+        cached = self._chan_cache.get(guild.id, {})
+        ch = guild.get_channel(cached.get(kind, 0))
+        if isinstance(ch, discord.TextChannel):
+            return ch
+
+        ch = _find_named_channel(guild, kind)
+        if ch is not None:
+            self._chan_cache.setdefault(guild.id, {})[kind] = ch.id
+        return ch
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        cached = self._chan_cache.get(channel.guild.id)
+        if cached:
+            for kind, ch_id in list(cached.items()):
+                if ch_id == channel.id:
+                    del cached[kind]
+
     # ---------------- ROUND CREATION HELPERS -----------------
 
     async def _get_or_create_matches_category(
@@ -333,111 +409,11 @@ class TournamentStartBracketCog(commands.Cog):
         clear_bracket(guild.id)
 
         # find current max match_id (should be 0 after clear, but safe)
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT COALESCE(MAX(match_id), 0) FROM bracket_matches WHERE guild_id = ?",
-            (guild.id,),
-        )
-        max_id = cur.fetchone()[0] or 0
-        conn.close()
-
-        match_index = max_id + 1
-        created = 0
-
-        for i in range(0, team_count, 2):
-            team_a = seeded[i]
-            team_b = seeded[i + 1]
-
-            row_a = by_name.get(team_a)
-            row_b = by_name.get(team_b)
-
-            overwrites = {
-                guild.default_role: discord.PermissionOverwrite(
-                    view_channel=False,
-                    send_messages=False,
-                    read_message_history=False,
-                )
-            }
-
-            def add_team_perms(row: Optional[dict]):
-                if not row:
-                    return
-                # sqlite3.Row supports dict-style indexing, but not .get()
-                try:
-                    role_id = row["role_id"]
-                except Exception:
-                    role_id = 0
-                if role_id:
-                    role = guild.get_role(role_id)
-                    if role:
-                        overwrites[role] = discord.PermissionOverwrite(
-                            view_channel=True,
-                            send_messages=True,
-                            read_message_history=True,
-                            attach_files=True,
-                        )
-
-            add_team_perms(row_a)
-            add_team_perms(row_b)
-
-            safe_a = team_a.lower().replace(" ", "-")
-            safe_b = team_b.lower().replace(" ", "-")
-            channel_name = f"match-{match_index}-{safe_a}-vs-{safe_b}"
-
-            match_channel = await matches_category.create_text_channel(
-                channel_name,
-                overwrites=overwrites,
-                reason="T0G Tournament round-1 match channel",
-            )
-
-            desc = (
-                f"📣 **Match Started!** **{team_a}** vs **{team_b}**\n\n"
-                f"Bracket Match **#{match_index}**, **Best-of-{best_of}**.\n\n"
-                "Use the **Score Match** button below to submit rounds won.\n"
-                "Captains can score only if Captain Scoring is ON, otherwise admins only.\n"
-                "No ties allowed. Results will be posted in **#bracket-and-scores**, "
-                "winner advances, and this channel will be deleted shortly after scoring."
-            )
-
-            embed = discord.Embed(
-                title=f"Match {match_index}: {team_a} vs {team_b}",
-                description=desc,
-                colour=discord.Colour.from_rgb(201, 0, 43),
-            )
-
-            view = ScoreMatchView(
-                guild_id=guild.id,
-                match_id=match_index,
-                team_a=team_a,
-                team_b=team_b,
-            )
-            await match_channel.send(embed=embed, view=view)
-
-            insert_bracket_match(
-                guild_id=guild.id,
-                match_id=match_index,
-                round_number=1,
-                team_a=team_a,
-                team_b=team_b,
-                winner=None,
-                status="PENDING",
-                channel_id=match_channel.id,
-            )
-
-            log.info(
-                "Created match %s in guild %s: %s vs %s (channel %s)",
-                match_index,
-                guild.id,
-                team_a,
-                team_b,
-                match_channel.id,
-            )
+        match_index = _max_match_id(guild.id) + 1
 
-            match_index += 1
-            created += 1
-
-        return created
+        return await self._create_round(
+            guild, matches_category, by_name, best_of, 1, seeded, match_index
+        )
 
     async def _create_next_round_matches(
         self,
@@ -473,111 +449,146 @@ class TournamentStartBracketCog(commands.Cog):
             recreate_reason=f"T0G Tournament: round-{round_number} matches category recreate",
         )
 
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT COALESCE(MAX(match_id), 0) FROM bracket_matches WHERE guild_id = ?",
-            (guild.id,),
+        match_index = _max_match_id(guild.id) + 1
+
+        return await self._create_round(
+            guild, matches_category, by_name, best_of, round_number, teams, match_index
         )
-        max_id = cur.fetchone()[0] or 0
-        conn.close()
 
-        match_index = max_id + 1
-        created = 0
+    async def _build_match(
+        self,
+        guild: discord.Guild,
+        matches_category: discord.CategoryChannel,
+        by_name: Dict[str, Any],
+        best_of: Any,
+        round_number: int,
+        match_index: int,
+        team_a: str,
+        team_b: str,
+    ) -> Tuple[tuple, Coroutine[Any, Any, discord.Message]]:
+        """
+        Create one match channel. Returns its bracket_matches row and the (not yet
+        awaited) send of the match message, so a round can post them together.
+        """
+        overwrites = {
+            guild.default_role: discord.PermissionOverwrite(
+                view_channel=False,
+                send_messages=False,
+                read_message_history=False,
+            )
+        }
+
+        def add_team_perms(row: Optional[dict]):
+            if not row:
+                return
+            # sqlite3.Row supports dict-style indexing, but not .get()
+            try:
+                role_id = row["role_id"]
+            except Exception:
+                role_id = 0
+            if role_id:
+                role = guild.get_role(role_id)
+                if role:
+                    overwrites[role] = discord.PermissionOverwrite(
+                        view_channel=True,
+                        send_messages=True,
+                        read_message_history=True,
+                        attach_files=True,
+                    )
 
-        for i in range(0, team_count, 2):
-            team_a = teams[i]
-            team_b = teams[i + 1]
+        add_team_perms(by_name.get(team_a))
+        add_team_perms(by_name.get(team_b))
 
-            row_a = by_name.get(team_a)
-            row_b = by_name.get(team_b)
+        safe_a = team_a.lower().replace(" ", "-")
+        safe_b = team_b.lower().replace(" ", "-")
+        channel_name = f"match-{match_index}-{safe_a}-vs-{safe_b}"
 
-            overwrites = {
-                guild.default_role: discord.PermissionOverwrite(
-                    view_channel=False,
-                    send_messages=False,
-                    read_message_history=False,
-                )
-            }
+        match_channel = await matches_category.create_text_channel(
+            channel_name,
+            overwrites=overwrites,
+            reason=f"T0G Tournament round-{round_number} match channel",
+        )
 
-            def add_team_perms(row: Optional[dict]):
-                if not row:
-                    return
-                try:
-                    role_id = row["role_id"]
-                except Exception:
-                    role_id = 0
-                if role_id:
-                    role = guild.get_role(role_id)
-                    if role:
-                        overwrites[role] = discord.PermissionOverwrite(
-                            view_channel=True,
-                            send_messages=True,
-                            read_message_history=True,
-                            attach_files=True,
-                        )
-
-            add_team_perms(row_a)
-            add_team_perms(row_b)
-
-            safe_a = team_a.lower().replace(" ", "-")
-            safe_b = team_b.lower().replace(" ", "-")
-            channel_name = f"match-{match_index}-{safe_a}-vs-{safe_b}"
-
-            match_channel = await matches_category.create_text_channel(
-                channel_name,
-                overwrites=overwrites,
-                reason=f"T0G Tournament round-{round_number} match channel",
-            )
+        desc = (
+            f"📣 **Match Started!** **{team_a}** vs **{team_b}**\n\n"
+            f"Bracket Match **#{match_index}**, **Best-of-{best_of}**.\n\n"
+            "Use the **Score Match** button below to submit rounds won.\n"
+            "Captains can score only if Captain Scoring is ON, otherwise admins only.\n"
+            "No ties allowed. Results will be posted in **#bracket-and-scores**, "
+            "winner advances, and this channel will be deleted shortly after scoring."
+        )
 
-            desc = (
-                f"📣 **Match Started!** **{team_a}** vs **{team_b}**\n\n"
-                f"Bracket Match **#{match_index}**, **Best-of-{best_of}**.\n\n"
-                "Use the **Score Match** button below to submit rounds won.\n"
-                "Captains can score only if Captain Scoring is ON, otherwise admins only.\n"
-                "No ties allowed. Results will be posted in **#bracket-and-scores**, "
-                "winner advances, and this channel will be deleted shortly after scoring."
-            )
+        embed = discord.Embed(
+            title=f"Match {match_index}: {team_a} vs {team_b}",
+            description=desc,
+            colour=discord.Colour.from_rgb(201, 0, 43),
+        )
 
-            embed = discord.Embed(
-                title=f"Match {match_index}: {team_a} vs {team_b}",
-                description=desc,
-                colour=discord.Colour.from_rgb(201, 0, 43),
-            )
+        view = ScoreMatchView(
+            guild_id=guild.id,
+            match_id=match_index,
+            team_a=team_a,
+            team_b=team_b,
+        )
 
-            view = ScoreMatchView(
-                guild_id=guild.id,
-                match_id=match_index,
-                team_a=team_a,
-                team_b=team_b,
-            )
-            await match_channel.send(embed=embed, view=view)
-
-            insert_bracket_match(
-                guild_id=guild.id,
-                match_id=match_index,
-                round_number=round_number,
-                team_a=team_a,
-                team_b=team_b,
-                winner=None,
-                status="PENDING",
-                channel_id=match_channel.id,
-            )
+        log.info(
+            "Created match %s (round %s) in guild %s: %s vs %s (channel %s)",
+            match_index,
+            round_number,
+            guild.id,
+            team_a,
+            team_b,
+            match_channel.id,
+        )
 
-            log.info(
-                "Created match %s (round %s) in guild %s: %s vs %s (channel %s)",
-                match_index,
-                round_number,
-                guild.id,
-                team_a,
-                team_b,
-                match_channel.id,
-            )
+        row = (guild.id, match_index, round_number, team_a, team_b, None, "PENDING", match_channel.id)
+        return row, match_channel.send(embed=embed, view=view)
 
-            match_index += 1
-            created += 1
+    async def _create_round(
+        self,
+        guild: discord.Guild,
+        matches_category: discord.CategoryChannel,
+        by_name: Dict[str, Any],
+        best_of: Any,
+        round_number: int,
+        teams: List[str],
+        match_index: int,
+    ) -> int:
+        """Pair up `teams` in order, create their match channels and save the round."""
+        rows: List[tuple] = []
+        sends = []
 
-        return created
+        # Channel creates stay sequential (they share the guild's channel bucket);
+        # the match messages are then posted together.
+        try:
+            for i in range(0, len(teams), 2):
+                row, send = await self._build_match(
+                    guild,
+                    matches_category,
+                    by_name,
+                    best_of,
+                    round_number,
+                    match_index,
+                    teams[i],
+                    teams[i + 1],
+                )
+                rows.append(row)
+                sends.append(send)
+                match_index += 1
+        finally:
+            # Post whatever was created even if a later create failed.
+            results = await asyncio.gather(*sends, return_exceptions=True)
+            for row, result in zip(rows, results):
+                if isinstance(result, Exception):
+                    log.warning(
+                        "Failed to post match %s message in guild %s: %r",
+                        row[1],
+                        guild.id,
+                        result,
+                    )
+            _insert_match_rows(rows)
+
+        return len(rows)
 
     # ---------------- BRACKET IMAGE UPDATE -----------------
 
@@ -670,16 +681,22 @@ class TournamentStartBracketCog(commands.Cog):
         # the round they lost in (round 1 => column 0, round 2 => column 1, etc.)
         eliminated_slots: List[tuple] = []
 
+        # team name -> slot per column (first occurrence, like list.index)
+        col_index_maps: List[Dict[str, int]] = []
+        for col in advancing_by_round:
+            index_map: Dict[str, int] = {}
+            for i, name in enumerate(col):
+                if name:
+                    index_map.setdefault(name, i)
+            col_index_maps.append(index_map)
+
         for team, rnd in loss_round.items():
             col_idx = rnd - 1  # round 1 -> column 0, round 2 -> column 1, ...
             if col_idx < 0 or col_idx >= len(advancing_by_round):
                 continue
 
-            col = advancing_by_round[col_idx]
-
-            try:
-                slot_index = col.index(team)
-            except ValueError:
+            slot_index = col_index_maps[col_idx].get(team)
+            if slot_index is None:
                 # should not normally happen, but skip if it does
                 continue
 
@@ -698,11 +715,7 @@ class TournamentStartBracketCog(commands.Cog):
                 bracket_channel = ch
 
         if bracket_channel is None:
-            guess = discord.utils.find(
-                lambda c: isinstance(c, discord.TextChannel)
-                and ("bracket-and-scores" in c.name or "bracket" in c.name),
-                guild.text_channels,
-            )
+            guess = self.resolve_named_channel(guild, "bracket")
             if guess:
                 bracket_channel = guess
                 t["bracket_channel_id"] = guess.id
@@ -711,6 +724,43 @@ class TournamentStartBracketCog(commands.Cog):
         if bracket_channel is None:
             return
 
+        # draw updated bracket (winners pushed forward, losers X'ed once);
+        # PIL work runs in a worker thread so the gateway heartbeat isn't starved
+        try:
+            png_bytes = await asyncio.to_thread(
+                draw_bracket_image,
+                seeds,
+                eliminated_slots=eliminated_slots,
+                advancing_by_round=advancing_by_round,
+            )
+        except Exception as e:
+            log.exception(
+                "Error drawing updated bracket image for guild %s: %r",
+                guild.id,
+                e,
+            )
+            return
+
+        content = f"🧾 Tournament Bracket (**{len(seeds)}** teams)"
+        # draw_bracket_image memoizes renders, so a repeated bracket state (e.g. a
+        # duplicate scoring event) hands back the same bytes: nothing to re-upload.
+        png_sig = hash(png_bytes)
+
+        # Known bracket message: swap its attachment in place (one PATCH, no history scan).
+        msg_id = self._bracket_msg_ids.get(guild.id)
+        if msg_id:
+            if self._bracket_png_sig.get(guild.id) == png_sig:
+                return
+            file = discord.File(io.BytesIO(png_bytes), filename="tournament_bracket.png")
+            try:
+                await bracket_channel.get_partial_message(msg_id).edit(
+                    content=content, attachments=[file]
+                )
+                self._bracket_png_sig[guild.id] = png_sig
+                return
+            except discord.NotFound:
+                self._bracket_msg_ids.pop(guild.id, None)
+
         # delete old bracket message
         try:
             async for msg in bracket_channel.history(limit=50):
@@ -730,24 +780,10 @@ class TournamentStartBracketCog(commands.Cog):
                 e,
             )
 
-        # draw updated bracket (winners pushed forward, losers X'ed once)
-        try:
-            png_bytes = draw_bracket_image(
-                seeds,
-                eliminated_slots=eliminated_slots,
-                advancing_by_round=advancing_by_round,
-            )
-        except Exception as e:
-            log.exception(
-                "Error drawing updated bracket image for guild %s: %r",
-                guild.id,
-                e,
-            )
-            return
-
         file = discord.File(io.BytesIO(png_bytes), filename="tournament_bracket.png")
-        content = f"🧾 Tournament Bracket (**{len(seeds)}** teams)"
-        await bracket_channel.send(content=content, file=file)
+        msg = await bracket_channel.send(content=content, file=file)
+        self._bracket_msg_ids[guild.id] = msg.id
+        self._bracket_png_sig[guild.id] = png_sig
 
 
     # ---------------- AFTER MATCH SCORED -----------------
@@ -759,97 +795,64 @@ class TournamentStartBracketCog(commands.Cog):
         - When an entire round is completed, creates the next round.
         - When only 1 team remains, marks tournament as FINISHED and announces winner.
         """
-        conn = get_db_connection()
-        cur = conn.cursor()
+        # One borrowed connection serves every read below (it goes back to the pool on exit).
+        with get_pooled_connection() as conn:
+            # rows of the current (highest) round in one query
+            rows = conn.execute(_SQL_CURRENT_ROUND_MATCHES, (guild.id, guild.id)).fetchall()
+            if not rows:
+                return
 
-        # current highest round
-        cur.execute(
-            "SELECT MAX(round_number) FROM bracket_matches WHERE guild_id = ?",
-            (guild.id,),
-        )
-        row = cur.fetchone()
-        if not row or row[0] is None:
-            conn.close()
-            return
+            current_round = rows[0]["round_number"]
 
-        current_round = row[0]
+            # who has won in this round so far?
+            winners = [
+                r["winner"]
+                for r in rows
+                if (r["status"] or "").upper() == "COMPLETED" and r["winner"]
+            ]
 
-        cur.execute(
-            """
-            SELECT match_id, team_a, team_b, winner, status
-            FROM bracket_matches
-            WHERE guild_id = ? AND round_number = ?
-            ORDER BY match_id ASC
-            """,
-            (guild.id, current_round),
-        )
-        rows = cur.fetchall()
-        conn.close()
+            all_completed = all((r["status"] or "").upper() == "COMPLETED" for r in rows)
 
-        if not rows:
-            return
+            # always refresh the bracket image so losers get X'ed and winners move down
+            await self._update_bracket_image(guild)
 
-        # who has won in this round so far?
-        winners = [
-            r["winner"]
-            for r in rows
-            if (r["status"] or "").upper() == "COMPLETED" and r["winner"]
-        ]
+            t = get_tournament(guild.id)
+            if not t:
+                return
 
-        all_completed = all((r["status"] or "").upper() == "COMPLETED" for r in rows)
+            # if the round isn't done yet, stop here
+            if not all_completed:
+                return
 
-        # always refresh the bracket image so losers get X'ed and winners move down
-        await self._update_bracket_image(guild)
+            # if we ended up with a single winner, tournament is over
+            if len(winners) == 1:
+                champion = winners[0]
 
-        t = get_tournament(guild.id)
-        if not t:
-            return
-
-        # if the round isn't done yet, stop here
-        if not all_completed:
-            return
+                # mark FINISHED and refresh panel
+                t["status"] = "FINISHED"
+                upsert_tournament(guild.id, t)
+                await update_panel_message(guild, t)
 
-        # if we ended up with a single winner, tournament is over
-        if len(winners) == 1:
-            champion = winners[0]
+                # final bracket image already updated above; announce champ
+                bracket_ch = None
+                bracket_channel_id = t.get("bracket_channel_id") or 0
+                if bracket_channel_id:
+                    ch = guild.get_channel(bracket_channel_id)
+                    if isinstance(ch, discord.TextChannel):
+                        bracket_ch = ch
 
-            # mark FINISHED and refresh panel
-            t["status"] = "FINISHED"
-            upsert_tournament(guild.id, t)
-            await update_panel_message(guild, t)
-
-            # final bracket image already updated above; announce champ
-            bracket_ch = None
-            bracket_channel_id = t.get("bracket_channel_id") or 0
-            if bracket_channel_id:
-                ch = guild.get_channel(bracket_channel_id)
-                if isinstance(ch, discord.TextChannel):
-                    bracket_ch = ch
-
-            if bracket_ch is None:
-                bracket_ch = discord.utils.find(
-                    lambda c: isinstance(c, discord.TextChannel)
-                    and ("bracket-and-scores" in c.name or "bracket" in c.name),
-                    guild.text_channels,
-                )
+                if bracket_ch is None:
+                    bracket_ch = self.resolve_named_channel(guild, "bracket")
 
-            if bracket_ch:
-                await bracket_ch.send(f"🏆 **Tournament Winner:** **{champion}**")
+                if bracket_ch:
+                    await bracket_ch.send(f"🏆 **Tournament Winner:** **{champion}**")
 
-            return
+                return
 
-        # otherwise, create the next round if it doesn't exist yet
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT COUNT(*) FROM bracket_matches
-            WHERE guild_id = ? AND round_number = ?
-            """,
-            (guild.id, current_round + 1),
-        )
-        next_count = cur.fetchone()[0]
-        conn.close()
+            # otherwise, create the next round if it doesn't exist yet
+            next_count = conn.execute(
+                _SQL_COUNT_ROUND_MATCHES, (guild.id, current_round + 1)
+            ).fetchone()[0]
 
         if next_count == 0:
             await self._create_next_round_matches(
@@ -962,7 +965,7 @@ class TournamentStartBracketCog(commands.Cog):
 
         try:
             # initial bracket: no eliminated teams, no winners yet
-            png_bytes = draw_bracket_image(seeded)
+            png_bytes = await asyncio.to_thread(draw_bracket_image, seeded)
         except Exception as e:
             log.exception(
                 "Error drawing bracket image for guild %s: %r",
@@ -983,11 +986,7 @@ class TournamentStartBracketCog(commands.Cog):
                 bracket_channel = ch
 
         if bracket_channel is None:
-            guess = discord.utils.find(
-                lambda c: isinstance(c, discord.TextChannel)
-                and ("bracket-and-scores" in c.name or "bracket" in c.name),
-                guild.text_channels,
-            )
+            guess = self.resolve_named_channel(guild, "bracket")
             if guess:
                 bracket_channel = guess
                 t["bracket_channel_id"] = guess.id
@@ -997,7 +996,10 @@ class TournamentStartBracketCog(commands.Cog):
 
         file = discord.File(io.BytesIO(png_bytes), filename="tournament_bracket.png")
         content = f"🧾 Tournament Bracket (**{count}** teams)"
-        await target_channel.send(content=content, file=file)
+        msg = await target_channel.send(content=content, file=file)
+        if bracket_channel is not None:
+            self._bracket_msg_ids[guild.id] = msg.id
+            self._bracket_png_sig[guild.id] = hash(png_bytes)
 
         if target_channel.id != interaction.channel_id:
             await interaction.followup.send(
@@ -1,46 +1,115 @@
 # cogs/bots_testing_cog.py
+import asyncio
 import logging
 import sqlite3
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Set, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from .tournament_db import get_db_connection, get_tournament  # your DB helper
+from core.db_pool import SQLiteConnectionPool
 
-log = logging.getLogger(__name__)
+from .tournament_db import get_tournament, invalidate_tournament  # your DB helper
 
+log = logging.getLogger(__name__)
 
-def ensure_bot_table():
-    """Ensure the bot_players table exists."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS bot_players (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            guild_id INTEGER NOT NULL,
-            label TEXT NOT NULL
+# Set once the DDL below has run; the schema doesn't change while the bot is up.
+_BOT_TABLE_READY = False
+
+# Name fragments that identify an existing "Tournament Teams" category.
+_TEAMS_CATEGORY_NEEDLES = ("tournament", "team")
+
+
+# Hot-path SQL, kept as constants so each pooled connection's statement cache
+# sees the exact same strings on every call.
+_SQL_FETCH_BOTS = "SELECT id, label FROM bot_players WHERE guild_id = ? ORDER BY id ASC"
+_SQL_RESERVE_BOT_NUMBERS = """
+    INSERT INTO bot_counters (guild_id, last_no)
+    VALUES (?, (SELECT COUNT(*) FROM bot_players WHERE guild_id = ?) + ?)
+    ON CONFLICT(guild_id) DO UPDATE SET last_no = bot_counters.last_no + ?
+    RETURNING last_no
+"""
+_SQL_ADD_BOT = "INSERT INTO bot_players (guild_id, label) VALUES (?, ?)"
+_SQL_DELETE_BOT = "DELETE FROM bot_players WHERE id = ?"
+_SQL_DELETE_GUILD_BOTS = "DELETE FROM bot_players WHERE guild_id = ?"
+_SQL_DELETE_GUILD_COUNTER = "DELETE FROM bot_counters WHERE guild_id = ?"
+_SQL_INSERT_BOT_TEAM = """
+    INSERT INTO teams (guild_id, team_name, role_id, hub_channel_id, captain_id, is_ready)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_BOT_TEAM_IDS = (
+    "SELECT role_id, hub_channel_id FROM teams WHERE guild_id = ? AND team_name LIKE 'Bot Team %'"
+)
+_SQL_HAS_BOTS = "SELECT 1 FROM bot_players WHERE guild_id = ? LIMIT 1"
+_SQL_DELETE_BOT_TEAMS = "DELETE FROM teams WHERE guild_id = ? AND team_name LIKE 'Bot Team %'"
+_SQL_SET_TEAMS_JOINED = "UPDATE tournaments SET teams_joined = ? WHERE guild_id = ?"
+_SQL_SET_BOT_TEAMS_CATEGORY = "UPDATE tournaments SET bot_teams_category_id = ? WHERE guild_id = ?"
+
+
+def _is_teams_category(cat: discord.CategoryChannel) -> bool:
+    name = cat.name.casefold()
+    return all(needle in name for needle in _TEAMS_CATEGORY_NEEDLES)
+
+
+async def ensure_bot_table(pool: SQLiteConnectionPool):
+    """Ensure the bot tables exist and teams/tournaments have the columns /bots uses."""
+    global _BOT_TABLE_READY
+    if _BOT_TABLE_READY:
+        return
+
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS bot_players (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                label TEXT NOT NULL
+            )
+            """
         )
-        """
-    )
-    conn.commit()
-    conn.close()
-
-
-def fetch_bots_for_guild(guild_id: int) -> List[sqlite3.Row]:
-    """Return all bot players for this guild."""
-    ensure_bot_table()
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT id, guild_id, label FROM bot_players WHERE guild_id = ? ORDER BY id ASC",
-        (guild_id,),
-    )
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+        # Covers both the per-guild filter and the ORDER BY id in fetch_bots_for_guild.
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bot_players_guild_id ON bot_players(guild_id, id)"
+        )
+        # Last "Bot #N" number handed out per guild (saves a COUNT(*) scan per /bots add).
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS bot_counters (
+                guild_id INTEGER PRIMARY KEY,
+                last_no INTEGER NOT NULL
+            )
+            """
+        )
+
+        # Older teams tables have no hub channel column; bot teams need it so
+        # /bots clear can delete by id instead of scanning every guild channel.
+        cur = await conn.execute("PRAGMA table_info(teams)")
+        cols = [r[1] for r in await cur.fetchall()]
+        if cols and "hub_channel_id" not in cols:
+            await conn.execute("ALTER TABLE teams ADD COLUMN hub_channel_id INTEGER")
+        if "team_name" in cols:
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_teams_guild_name ON teams(guild_id, team_name)"
+            )
+
+        # Remember the "Tournament Teams" category so force_teams doesn't rescan categories.
+        cur = await conn.execute("PRAGMA table_info(tournaments)")
+        cols = [r[1] for r in await cur.fetchall()]
+        if cols and "bot_teams_category_id" not in cols:
+            await conn.execute("ALTER TABLE tournaments ADD COLUMN bot_teams_category_id INTEGER")
+
+        await conn.commit()
+
+    _BOT_TABLE_READY = True
+
+
+async def fetch_bots_for_guild(pool: SQLiteConnectionPool, guild_id: int) -> List[Tuple[int, str]]:
+    """Return all bot players for this guild as (id, label) tuples."""
+    async with pool.acquire() as conn:
+        cur = await conn.execute(_SQL_FETCH_BOTS, (guild_id,))
+        cur.row_factory = None  # plain tuples; only two columns are used
+        return list(await cur.fetchall())
 
 
 class BotsTestingCog(commands.Cog):
@@ -52,7 +121,82 @@ class BotsTestingCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        ensure_bot_table()
+        self.pool: SQLiteConnectionPool = bot.db_pool
+        self._db_locks: Dict[int, asyncio.Lock] = {}
+        self._bg_tasks: Set[asyncio.Task] = set()
+
+    async def cog_load(self):
+        await ensure_bot_table(self.pool)
+
+    def _db_lock(self, guild_id: int) -> asyncio.Lock:
+        """Per-guild lock so concurrent /bots commands serialize their DB writes."""
+        lock = self._db_locks.get(guild_id)
+        if lock is None:
+            lock = self._db_locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def _refresh_panels(self, guild: discord.Guild, command: str):
+        # refresh panels if helpers exist
+        t_cog = self.bot.get_cog("TournamentCog")
+        if t_cog is None:
+            return
+
+        refreshers = [
+            fn for fn in (
+                getattr(t_cog, "refresh_admin_panels", None),
+                getattr(t_cog, "refresh_join_panels", None),
+            )
+            if callable(fn)
+        ]
+        # Both are independent message edits, so let them overlap.
+        results = await asyncio.gather(*(fn(guild) for fn in refreshers), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                log.error(
+                    "Error refreshing panels after /bots %s: %s",
+                    command,
+                    result,
+                    exc_info=result,
+                )
+
+    async def _persist_force_teams(
+        self,
+        guild: discord.Guild,
+        new_teams_joined: int,
+        team_rows: List[Tuple[int, str, int, int, int, int]],
+        used_bot_ids: List[int],
+    ):
+        """DB-write phase of /bots force_teams (runs after the user has their reply)."""
+        async with self._db_lock(guild.id):
+            async with self.pool.acquire() as conn:
+                try:
+                    await conn.execute("BEGIN")
+
+                    # update tournaments table
+                    await conn.execute(_SQL_SET_TEAMS_JOINED, (new_teams_joined, guild.id))
+
+                    # Insert bot teams into the REAL teams table
+                    try:
+                        await conn.executemany(_SQL_INSERT_BOT_TEAM, team_rows)
+                    except sqlite3.OperationalError as e:
+                        # If teams table somehow missing, log it (should not happen)
+                        log.exception("Error inserting bot teams into teams table: %s", e)
+
+                    # delete used bots from bot_players (one cached statement for any count;
+                    # ids can have gaps when a team failed to create)
+                    if used_bot_ids:
+                        await conn.executemany(
+                            _SQL_DELETE_BOT, [(bot_id,) for bot_id in used_bot_ids]
+                        )
+
+                    await conn.commit()
+                except Exception as e:
+                    await conn.rollback()
+                    log.exception("DB error in /bots force_teams: %s", e)
+                finally:
+                    invalidate_tournament(guild.id)
+
+        await self._refresh_panels(guild, "force_teams")
 
     bots = app_commands.Group(
         name="bots",
@@ -84,37 +228,31 @@ class BotsTestingCog(commands.Cog):
             )
             return
 
-        ensure_bot_table()
-        conn = get_db_connection()
-        cur = conn.cursor()
+        async with self._db_lock(guild.id), self.pool.acquire() as conn:
+            try:
+                await conn.execute("BEGIN")
 
-        # how many bots already exist for this guild
-        cur.execute(
-            "SELECT COUNT(*) FROM bot_players WHERE guild_id = ?",
-            (guild.id,),
-        )
-        existing = cur.fetchone()[0] or 0
-
-        new_labels: List[str] = []
-        try:
-            for i in range(count):
-                label = f"Bot #{existing + i + 1}"
-                cur.execute(
-                    "INSERT INTO bot_players (guild_id, label) VALUES (?, ?)",
-                    (guild.id, label),
+                # Reserve `count` label numbers. A guild's first row is seeded from the
+                # bots it already has so numbering continues where it left off.
+                cur = await conn.execute(
+                    _SQL_RESERVE_BOT_NUMBERS, (guild.id, guild.id, count, count)
                 )
-                new_labels.append(label)
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            log.exception("DB error in /bots add: %s", e)
-            await interaction.followup.send(
-                "❌ There was a database error while adding bots.",
-                ephemeral=True,
-            )
-            return
-        finally:
-            conn.close()
+                last_no = (await cur.fetchone())[0]
+                existing = last_no - count
+
+                new_labels: List[str] = [f"Bot #{existing + i + 1}" for i in range(count)]
+                await conn.executemany(
+                    _SQL_ADD_BOT, [(guild.id, label) for label in new_labels]
+                )
+                await conn.commit()
+            except Exception as e:
+                await conn.rollback()
+                log.exception("DB error in /bots add: %s", e)
+                await interaction.followup.send(
+                    "❌ There was a database error while adding bots.",
+                    ephemeral=True,
+                )
+                return
 
         lines = [
             f"✅ Added **{len(new_labels)}** bot players for this server.",
@@ -171,7 +309,7 @@ class BotsTestingCog(commands.Cog):
         max_teams = t_data.get("max_teams") or 0
         teams_joined = t_data.get("teams_joined", 0) or 0
 
-        bots = fetch_bots_for_guild(guild.id)
+        bots = await fetch_bots_for_guild(self.pool, guild.id)
         if not bots:
             await interaction.followup.send(
                 "⚠️ There are **no bot players** stored for this server.\n"
@@ -199,12 +337,16 @@ class BotsTestingCog(commands.Cog):
         # ---------- get / create DEDICATED TEAMS CATEGORY ----------
         teams_category: Optional[discord.CategoryChannel] = None
 
+        # Reuse the category id remembered on the tournament row (cache dict lookup)
+        cached_category_id = t_data.get("bot_teams_category_id")
+        if cached_category_id:
+            ch = guild.get_channel(cached_category_id)
+            if isinstance(ch, discord.CategoryChannel):
+                teams_category = ch
+
         # Try to find existing "Tournament Teams" category
-        for cat in guild.categories:
-            name_lower = cat.name.lower()
-            if "tournament" in name_lower and "team" in name_lower:
-                teams_category = cat
-                break
+        if teams_category is None:
+            teams_category = discord.utils.find(_is_teams_category, guild.categories)
 
         if teams_category is None:
             # Try to position near the main tournament category (if we have one)
@@ -226,23 +368,25 @@ class BotsTestingCog(commands.Cog):
                 except Exception:
                     pass
 
-        category: Optional[discord.CategoryChannel] = teams_category
+        if teams_category.id != cached_category_id:
+            async with self._db_lock(guild.id), self.pool.acquire() as conn:
+                try:
+                    await conn.execute(
+                        _SQL_SET_BOT_TEAMS_CATEGORY, (teams_category.id, guild.id)
+                    )
+                    await conn.commit()
+                    invalidate_tournament(guild.id)
+                except Exception as e:
+                    log.exception("Failed to store bot teams category id: %s", e)
 
-        created_teams: List[Tuple[str, discord.Role, discord.TextChannel, List[str]]] = []
-        used_bot_ids: List[int] = []
+        category: Optional[discord.CategoryChannel] = teams_category
 
         everyone = guild.default_role
         tournament_admin_role = None  # set this if you have a specific staff role
 
-        # group bots into teams
-        for t_idx in range(teams_to_create):
-            # slice bots for this team
-            start = t_idx * team_size
-            end = start + team_size
-            group = bots[start:end]
-            if not group:
-                break
-
+        async def _make_team(
+            t_idx: int, group: List[Tuple[int, str]]
+        ) -> Tuple[str, discord.Role, discord.TextChannel, List[str], List[int]]:
             # team index based on teams_joined
             team_number = teams_joined + t_idx + 1
             team_name = f"Bot Team {team_number}"
@@ -250,9 +394,9 @@ class BotsTestingCog(commands.Cog):
             channel_name = f"team-bot-{team_number}"
 
             # collect labels and ids
-            bot_labels = [row["label"] for row in group]
-            bot_ids = [row["id"] for row in group]
-            used_bot_ids.extend(bot_ids)
+            ids, labels = zip(*group)
+            bot_ids: List[int] = list(ids)
+            bot_labels: List[str] = list(labels)
 
             # ---- create role ----
             role = await guild.create_role(
@@ -304,92 +448,57 @@ class BotsTestingCog(commands.Cog):
                 f"Bot players:\n{bot_list_text}"
             )
 
-            created_teams.append((team_name, role, channel, bot_labels))
-
-        # ---- update DB: teams_joined and teams table + remove used bots ----
-        conn = get_db_connection()
-        cur = conn.cursor()
-        new_teams_joined = teams_joined + len(created_teams)
-        try:
-            # update tournaments table
-            cur.execute(
-                "UPDATE tournaments SET teams_joined = ? WHERE guild_id = ?",
-                (new_teams_joined, guild.id),
-            )
+            return team_name, role, channel, bot_labels, bot_ids
 
-            # Insert bot teams into the REAL teams table
-            # Schema: guild_id, team_id (auto), team_name, role_id, captain_id, is_ready
-            for team_name, role, channel, _ in created_teams:
-                try:
-                    cur.execute(
-                        """
-                        INSERT INTO teams (
-                            guild_id,
-                            team_name,
-                            role_id,
-                            captain_id,
-                            is_ready
-                        ) VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (
-                            guild.id,
-                            team_name,
-                            role.id,
-                            interaction.user.id,  # treat the command user as "captain"
-                            1,  # mark bot teams as READY in DB
-                        ),
-                    )
-                except sqlite3.OperationalError as e:
-                    # If teams table somehow missing, log it (should not happen)
-                    log.exception("Error inserting bot team into teams table: %s", e)
-
-            # delete used bots from bot_players
-            if used_bot_ids:
-                q_marks = ",".join("?" for _ in used_bot_ids)
-                cur.execute(
-                    f"DELETE FROM bot_players WHERE id IN ({q_marks})",
-                    used_bot_ids,
-                )
-
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            log.exception("DB error in /bots force_teams: %s", e)
-        finally:
-            conn.close()
-
-        # refresh panels if helpers exist
-        t_cog = self.bot.get_cog("TournamentCog")
-        if t_cog is not None:
-            try:
-                refresh_admin = getattr(t_cog, "refresh_admin_panels", None)
-                if callable(refresh_admin):
-                    await refresh_admin(guild)
+        # group bots into teams; REST calls overlap (discord.py still applies rate limits)
+        groups = [bots[i * team_size:(i + 1) * team_size] for i in range(teams_to_create)]
+        results = await asyncio.gather(
+            *(_make_team(i, group) for i, group in enumerate(groups) if group),
+            return_exceptions=True,
+        )
 
-                refresh_join = getattr(t_cog, "refresh_join_panels", None)
-                if callable(refresh_join):
-                    await refresh_join(guild)
-            except Exception as e:
-                log.exception("Error refreshing panels after /bots force_teams: %s", e)
+        created_teams: List[Tuple[str, discord.Role, discord.TextChannel, List[str]]] = []
+        used_bot_ids: List[int] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                log.error("Failed to create bot team in guild %s: %r", guild.id, result)
+                continue
+            team_name, role, channel, bot_labels, bot_ids = result
+            created_teams.append((team_name, role, channel, bot_labels))
+            used_bot_ids.extend(bot_ids)
 
-        # reply
-        lines = [
-            f"✅ Forced **{len(created_teams)}** bot teams using stored bots.",
-            f"- team_size: `{team_size}`",
-            f"- max_teams: `{max_teams}`",
-            f"- teams_joined (new): `{new_teams_joined}`",
-            "",
-            "**Created Teams:**",
+        # ---- update DB in the background: teams_joined, teams table, used bots ----
+        # Schema: guild_id, team_id (auto), team_name, role_id, hub_channel_id, captain_id, is_ready
+        # The command user is treated as "captain"; bot teams are marked READY.
+        new_teams_joined = teams_joined + len(created_teams)
+        team_rows = [
+            (guild.id, team_name, role.id, channel.id, interaction.user.id, 1)
+            for team_name, role, channel, _ in created_teams
         ]
-        for team_name, role, channel, bot_labels in created_teams:
-            bot_line = ", ".join(bot_labels)
-            lines.append(f"• {team_name} — {role.mention} — {channel.mention} ({bot_line})")
-
-        # If this ever hits 2000 chars we might need to trim, but keeping your behavior for now
-        text = "\n".join(lines)
-        if len(text) > 2000:
-            text = text[:1990] + "\n…(trimmed)"
-        await interaction.followup.send(text, ephemeral=True)
+        task = asyncio.create_task(
+            self._persist_force_teams(guild, new_teams_joined, team_rows, used_bot_ids)
+        )
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
+        # reply (embed: one field per team, Discord caps embeds at 25 fields)
+        embed = discord.Embed(
+            title=f"✅ Forced {len(created_teams)} bot teams",
+            description=(
+                f"team_size `{team_size}` • max_teams `{max_teams}` • "
+                f"teams_joined (new) `{new_teams_joined}`"
+            ),
+            color=discord.Color.green(),
+        )
+        for team_name, role, channel, bot_labels in created_teams[:25]:
+            embed.add_field(
+                name=team_name,
+                value=f"{role.mention} {channel.mention}\n{', '.join(bot_labels)}"[:1024],
+                inline=False,
+            )
+        if len(created_teams) > 25:
+            embed.set_footer(text=f"…and {len(created_teams) - 25} more teams")
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     # ------------- /bots clear -------------
 
@@ -412,75 +521,92 @@ class BotsTestingCog(commands.Cog):
         t_data: Optional[Dict[str, Any]] = get_tournament(guild.id)
         teams_joined = t_data.get("teams_joined", 0) if t_data else 0
 
-        deleted_teams = 0
-
-        # delete team-bot-* channels
-        for ch in guild.channels:
-            if isinstance(ch, discord.TextChannel) and ch.name.startswith("team-bot"):
-                try:
-                    await ch.delete(reason="[BotsTestingCog] Clearing bot teams")
-                    deleted_teams += 1
-                except Exception:
-                    pass
-
-        # delete roles named "Bot Team X"
-        for role in guild.roles:
-            if role.name.startswith("Bot Team "):
-                try:
-                    await role.delete(reason="[BotsTestingCog] Clearing bot teams")
-                except Exception:
-                    pass
-
-        # DB cleanup
-        conn = get_db_connection()
-        cur = conn.cursor()
-        try:
-            # delete bot teams from teams table by name pattern (bots are stored as normal teams)
+        # Resolve bot team roles/channels from the ids stored by /bots force_teams
+        # (guild.get_role / get_channel are cache dict lookups).
+        id_rows: List[sqlite3.Row] = []
+        teams_query_ok = False
+        async with self.pool.acquire() as conn:
             try:
-                cur.execute(
-                    "DELETE FROM teams WHERE guild_id = ? AND team_name LIKE 'Bot Team %'",
-                    (guild.id,),
-                )
+                cur = await conn.execute(_SQL_BOT_TEAM_IDS, (guild.id,))
+                id_rows = list(await cur.fetchall())
+                teams_query_ok = True
             except sqlite3.OperationalError:
-                # teams table missing would be unexpected, but don't crash
                 pass
 
-            # delete all bot_players for this guild
-            ensure_bot_table()
-            cur.execute(
-                "DELETE FROM bot_players WHERE guild_id = ?",
-                (guild.id,),
-            )
+            cur = await conn.execute(_SQL_HAS_BOTS, (guild.id,))
+            has_bot_players = await cur.fetchone() is not None
 
-            # adjust tournaments.teams_joined
-            if t_data and deleted_teams > 0:
-                new_val = max(0, teams_joined - deleted_teams)
-                cur.execute(
-                    "UPDATE tournaments SET teams_joined = ? WHERE guild_id = ?",
-                    (new_val, guild.id),
-                )
-                teams_joined = new_val
+        if teams_query_ok and not id_rows and not has_bot_players:
+            await interaction.followup.send(
+                "🧹 Nothing to clear: no bot teams or stored bot players for this server.",
+                ephemeral=True,
+            )
+            return
 
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            log.exception("DB error in /bots clear: %s", e)
-        finally:
-            conn.close()
+        def _scan_bot_channels() -> List[discord.TextChannel]:
+            return [
+                ch for ch in guild.channels
+                if isinstance(ch, discord.TextChannel) and ch.name.startswith("team-bot")
+            ]
+
+        if teams_query_ok:
+            channels_to_delete = [
+                ch for ch in (guild.get_channel(r["hub_channel_id"]) for r in id_rows if r["hub_channel_id"])
+                if ch is not None
+            ]
+            roles_to_delete = [
+                role for role in (guild.get_role(r["role_id"]) for r in id_rows if r["role_id"])
+                if role is not None
+            ]
+            if any(not r["hub_channel_id"] for r in id_rows):
+                # Bot teams from before channel ids were stored: find their channels by name.
+                known = {ch.id for ch in channels_to_delete}
+                channels_to_delete += [ch for ch in _scan_bot_channels() if ch.id not in known]
+        else:
+            # teams table doesn't have the shape /bots writes: fall back to the name scan.
+            channels_to_delete = _scan_bot_channels()
+            roles_to_delete = [role for role in guild.roles if role.name.startswith("Bot Team ")]
+
+        reason = "[BotsTestingCog] Clearing bot teams"
+        results = await asyncio.gather(
+            *(ch.delete(reason=reason) for ch in channels_to_delete),
+            *(role.delete(reason=reason) for role in roles_to_delete),
+            return_exceptions=True,
+        )
+        deleted_teams = sum(
+            1 for r in results[:len(channels_to_delete)] if not isinstance(r, BaseException)
+        )
 
-        # refresh panels if helpers exist
-        t_cog = self.bot.get_cog("TournamentCog")
-        if t_cog is not None:
+        # DB cleanup: all three statements share one transaction (one commit)
+        async with self._db_lock(guild.id), self.pool.acquire() as conn:
             try:
-                refresh_admin = getattr(t_cog, "refresh_admin_panels", None)
-                if callable(refresh_admin):
-                    await refresh_admin(guild)
+                await conn.execute("BEGIN")
 
-                refresh_join = getattr(t_cog, "refresh_join_panels", None)
-                if callable(refresh_join):
-                    await refresh_join(guild)
+                # delete bot teams from teams table by name pattern (bots are stored as normal teams)
+                try:
+                    await conn.execute(_SQL_DELETE_BOT_TEAMS, (guild.id,))
+                except sqlite3.OperationalError:
+                    # teams table missing would be unexpected, but don't crash
+                    pass
+
+                # delete all bot_players for this guild (numbering restarts at Bot #1)
+                await conn.execute(_SQL_DELETE_GUILD_BOTS, (guild.id,))
+                await conn.execute(_SQL_DELETE_GUILD_COUNTER, (guild.id,))
+
+                # adjust tournaments.teams_joined
+                if t_data and deleted_teams > 0:
+                    new_val = max(0, teams_joined - deleted_teams)
+                    await conn.execute(_SQL_SET_TEAMS_JOINED, (new_val, guild.id))
+                    teams_joined = new_val
+
+                await conn.commit()
             except Exception as e:
-                log.exception("Error refreshing panels after /bots clear: %s", e)
+                await conn.rollback()
+                log.exception("DB error in /bots clear: %s", e)
+            finally:
+                invalidate_tournament(guild.id)
+
+        await self._refresh_panels(guild, "clear")
 
         await interaction.followup.send(
             f"🧹 Cleared **{deleted_teams}** bot teams (channels + roles) "
@@ -1,19 +1,29 @@
 # cogs/tournament_admin_panel.py
+import asyncio
+import importlib
 import logging
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 import discord
 from discord.ui import Modal, TextInput
 from discord.ext import commands  # needed for setup()
 
-from .tournament_db import get_tournament, upsert_tournament, delete_tournament
+from .discord_safe import safe_delete_invite, safe_fetch_invite
+from .tournament_db import (
+    adelete_tournament,
+    aget_tournament,
+    aupsert_tournament,
+    get_tournament,
+    patch_cached_tournament,
+)
 
 # We only import the refresh helper (no circular import, join_panel_cog does not import this file)
 try:
     from .join_panel_cog import refresh_join_panel_message
 except Exception:
     # In case join_panel_cog isn't loaded yet, we'll just skip refreshing the join panel
-    async def refresh_join_panel_message(guild: discord.Guild):
+    async def refresh_join_panel_message(guild: discord.Guild, t: Optional[Dict[str, Any]] = None):
         return
 
 log = logging.getLogger(__name__)
@@ -21,180 +31,336 @@ log = logging.getLogger(__name__)
 
 # ---------- OPTIONAL PER-CHANNEL INITIALIZERS ----------
 
-async def init_announcements_channel(channel: discord.TextChannel) -> None:
-    try:
-        from .tournament_announcements_cog import setup_tournament_announcements_channel
-    except Exception:
-        log.debug("No tournament_announcements_cog.setup_tournament_announcements_channel found; skipping.")
-        return
-
-    try:
-        await setup_tournament_announcements_channel(channel)
-    except Exception as e:
-        log.exception("Error in setup_tournament_announcements_channel for %s: %r", channel.id, e)
-
-
-async def init_rules_channel(channel: discord.TextChannel) -> None:
-    try:
-        from .tournament_rules_cog import setup_tournament_rules_channel
-    except Exception:
-        log.debug("No tournament_rules_cog.setup_tournament_rules_channel found; skipping.")
-        return
-
-    try:
-        await setup_tournament_rules_channel(channel)
-    except Exception as e:
-        log.exception("Error in setup_tournament_rules_channel for %s: %r", channel.id, e)
+# kind -> (sibling module, setup function). Each cog is optional; a missing module or
+# function just means that channel starts empty.
+_CHANNEL_SETUPS: Dict[str, Tuple[str, str]] = {
+    "announcements": ("tournament_announcements_cog", "setup_tournament_announcements_channel"),
+    "rules": ("tournament_rules_cog", "setup_tournament_rules_channel"),
+    "create_team": ("tournament_create_team_cog", "setup_create_team_channel"),
+    "teams": ("tournament_teams_cog", "setup_tournament_teams_channel"),
+    "bracket": ("tournament_bracket_cog", "setup_bracket_and_scores_channel"),
+    "results": ("tournament_results_cog", "setup_match_results_channel"),
+}
 
+# Resolved on first use (importing at module load would be circular for some cogs).
+_resolved_setups: Dict[str, Optional[Callable[[discord.TextChannel], Awaitable[None]]]] = {}
 
-async def init_create_team_channel(channel: discord.TextChannel) -> None:
-    try:
-        from .tournament_create_team_cog import setup_create_team_channel
-    except Exception:
-        log.debug("No tournament_create_team_cog.setup_create_team_channel found; skipping.")
-        return
-
-    try:
-        await setup_create_team_channel(channel)
-    except Exception as e:
-        log.exception("Error in setup_create_team_channel for %s: %r", channel.id, e)
 
+def _resolve_channel_setup(kind: str) -> Optional[Callable[[discord.TextChannel], Awaitable[None]]]:
+    if kind in _resolved_setups:
+        return _resolved_setups[kind]
 
-async def init_teams_channel(channel: discord.TextChannel) -> None:
+    module_name, attr = _CHANNEL_SETUPS[kind]
     try:
-        from .tournament_teams_cog import setup_tournament_teams_channel
+        module = importlib.import_module(f".{module_name}", __package__)
+        fn = getattr(module, attr)
     except Exception:
-        log.debug("No tournament_teams_cog.setup_tournament_teams_channel found; skipping.")
-        return
+        log.debug("No %s.%s found; skipping.", module_name, attr)
+        fn = None
 
-    try:
-        await setup_tournament_teams_channel(channel)
-    except Exception as e:
-        log.exception("Error in setup_tournament_teams_channel for %s: %r", channel.id, e)
+    _resolved_setups[kind] = fn
+    return fn
 
 
-async def init_bracket_channel(channel: discord.TextChannel) -> None:
-    try:
-        from .tournament_bracket_cog import setup_bracket_and_scores_channel
-    except Exception:
-        log.debug("No tournament_bracket_cog.setup_bracket_and_scores_channel found; skipping.")
+async def init_channel(kind: str, channel: discord.TextChannel) -> None:
+    fn = _resolve_channel_setup(kind)
+    if fn is None:
         return
 
     try:
-        await setup_bracket_and_scores_channel(channel)
+        await fn(channel)
     except Exception as e:
-        log.exception("Error in setup_bracket_and_scores_channel for %s: %r", channel.id, e)
-
-
-async def init_results_channel(channel: discord.TextChannel) -> None:
-    try:
-        from .tournament_results_cog import setup_match_results_channel
-    except Exception:
-        log.debug("No tournament_results_cog.setup_match_results_channel found; skipping.")
-        return
-
-    try:
-        await setup_match_results_channel(channel)
-    except Exception as e:
-        log.exception("Error in setup_match_results_channel for %s: %r", channel.id, e)
+        log.exception("Error in %s for %s: %r", _CHANNEL_SETUPS[kind][1], channel.id, e)
 
 
 # ---------- Embed Builder (Admin Panel) ----------
 
 def build_tournament_embed(t: Dict[str, Any]) -> discord.Embed:
-    name = t["name"]
-    max_teams = t["max_teams"]
-    teams_joined = t.get("teams_joined", 0)
-    team_size = t["team_size"]
-    best_of = t["best_of"]
-    bracket_type = t["bracket_type"]
-    captain_scoring = bool(t["captain_scoring"])
-    screenshot_proof = bool(t["screenshot_proof"])
-    queue_status = t["queue_status"]
-    status = t["status"]
-
+    """Admin panel embed. Field texts are cached per settings; each call gets a new Embed."""
     embed = discord.Embed(
         title="🛠️ TOURNAMENT CONTROL PANEL",
-        description=f"Tournament Name: **{name}**",
+        description=f"Tournament Name: **{t['name']}**",
         color=discord.Color.red()
     )
+    for name, value, inline in _tournament_embed_fields(
+        t["max_teams"],
+        t.get("teams_joined", 0),
+        t["team_size"],
+        t["best_of"],
+        t["bracket_type"],
+        bool(t["captain_scoring"]),
+        bool(t["screenshot_proof"]),
+        t["queue_status"],
+        t["status"],
+    ):
+        embed.add_field(name=name, value=value, inline=inline)
 
-    embed.add_field(
-        name="Teams Joined",
-        value=f"{teams_joined} / {max_teams}\n"
-              f"(Recommended bracket sizes: **4, 8, 16, 32**)",
-        inline=False
-    )
+    embed.set_footer(text="Use the tournament commands to manage your tournament.")
+    return embed
 
-    embed.add_field(
-        name="Team Size",
-        value=f"{team_size} (1–6)",
-        inline=True
-    )
 
-    embed.add_field(
-        name="Match Format",
-        value=f"Best-of-{best_of} Games\n(1 = BO1, 3 = BO3, 5 = BO5)",
-        inline=True
+# Immutable (name, value, inline) tuples: safe to share, unlike a cached Embed.
+@lru_cache(maxsize=256)
+def _tournament_embed_fields(
+    max_teams: int,
+    teams_joined: int,
+    team_size: int,
+    best_of: int,
+    bracket_type: str,
+    captain_scoring: bool,
+    screenshot_proof: bool,
+    queue_status: str,
+    status: str,
+) -> Tuple[Tuple[str, str, bool], ...]:
+    return (
+        (
+            "Teams Joined",
+            f"{teams_joined} / {max_teams}\n"
+            f"(Recommended bracket sizes: **4, 8, 16, 32**)",
+            False,
+        ),
+        ("Team Size", f"{team_size} (1–6)", True),
+        ("Match Format", f"Best-of-{best_of} Games\n(1 = BO1, 3 = BO3, 5 = BO5)", True),
+        ("Bracket Type", bracket_type, True),
+        ("Captain Scoring", "ON (Captains + Admins)" if captain_scoring else "OFF (Admins Only)", True),
+        ("Screenshot Proof", "ON" if screenshot_proof else "OFF", True),
+        ("Queue Status", queue_status, True),
+        ("Tournament Status", status, True),
     )
 
-    embed.add_field(
-        name="Bracket Type",
-        value=bracket_type,
-        inline=True
-    )
 
-    embed.add_field(
-        name="Captain Scoring",
-        value="ON (Captains + Admins)" if captain_scoring else "OFF (Admins Only)",
-        inline=True
-    )
+# ---------- Control Panel Updater (no buttons) ----------
 
-    embed.add_field(
-        name="Screenshot Proof",
-        value="ON" if screenshot_proof else "OFF",
-        inline=True
-    )
+# Fields build_tournament_embed() renders; if none changed, the panel is already current.
+_PANEL_EMBED_FIELDS = (
+    "name",
+    "teams_joined",
+    "max_teams",
+    "team_size",
+    "best_of",
+    "bracket_type",
+    "captain_scoring",
+    "screenshot_proof",
+    "queue_status",
+    "status",
+)
 
-    embed.add_field(
-        name="Queue Status",
-        value=queue_status,
-        inline=True
-    )
+# (channel_id, message_id) -> signature of the embed last written to that message.
+_LAST_EMBED_SIG: Dict[Tuple[int, int], int] = {}
 
-    embed.add_field(
-        name="Tournament Status",
-        value=status,
-        inline=True
-    )
 
-    embed.set_footer(text="Use the tournament commands to manage your tournament.")
-    return embed
+# Panel edits are coalesced: updates arriving within this window collapse into one
+# msg.edit carrying the latest state (a message allows ~5 edits per 5s).
+_PANEL_EDIT_DELAY = 1.0
 
+_pending_panels: Dict[Tuple[int, int], Dict[str, Any]] = {}
+_panel_tasks: Dict[Tuple[int, int], "asyncio.Task[None]"] = {}
 
-# ---------- Control Panel Updater (no buttons) ----------
 
 async def update_panel_message(guild: discord.Guild, t: Dict[str, Any]) -> None:
+    """Schedule an admin panel refresh; returns without waiting for the edit."""
+    queue_panel_edit(guild, t)
+
+
+def queue_panel_edit(guild: discord.Guild, t: Dict[str, Any]) -> None:
+    """Sync form of update_panel_message(), for callers that can't await."""
     channel_id = t.get("panel_channel_id")
     message_id = t.get("panel_message_id")
     if not channel_id or not message_id:
         return
 
+    key = (channel_id, message_id)
+    _pending_panels[key] = dict(t)
+    if key not in _panel_tasks:
+        _panel_tasks[key] = asyncio.create_task(_flush_panel_message(guild, key))
+
+
+async def _flush_panel_message(guild: discord.Guild, key: Tuple[int, int]) -> None:
+    try:
+        # Keep going while updates keep arriving, so none is left behind.
+        while key in _pending_panels:
+            await asyncio.sleep(_PANEL_EDIT_DELAY)
+            t = _pending_panels.pop(key)
+            try:
+                await _edit_panel_message(guild, t)
+            except Exception as e:
+                log.exception("Guild %s: Failed to update admin panel %s: %r", guild.id, key, e)
+    finally:
+        _panel_tasks.pop(key, None)
+
+
+async def _edit_panel_message(guild: discord.Guild, t: Dict[str, Any]) -> None:
+    channel_id = t["panel_channel_id"]
+    message_id = t["panel_message_id"]
+
+    # Identical embed: skip the edit entirely.
+    key = (channel_id, message_id)
+    sig = hash(tuple(t.get(field) for field in _PANEL_EMBED_FIELDS))
+    if _LAST_EMBED_SIG.get(key) == sig:
+        return
+
     channel = guild.get_channel(channel_id)
     if not channel:
         return
 
+    # Edit through a PartialMessage: no fetch_message GET before the PATCH.
+    embed = build_tournament_embed(t)
     try:
-        msg = await channel.fetch_message(message_id)
+        await channel.get_partial_message(message_id).edit(embed=embed)
     except discord.NotFound:
+        _LAST_EMBED_SIG.pop(key, None)
         return
+    _LAST_EMBED_SIG[key] = sig
+
+
+class PanelRefreshDebouncer:
+    """Refresh both panels after a settings change, debouncing the join panel per guild.
+
+    The admin panel edit is handed straight to queue_panel_edit(), which already
+    coalesces per message; delaying it here too would stack a second wait on top.
+    Join panel refreshes arriving within `delay` collapse into one carrying the last state.
+    Both edits go through discord.py's own HTTP client (one pooled keep-alive session
+    per bot); don't add a private aiohttp session for panel traffic.
+    """
+
+    def __init__(self, delay: float = 0.4) -> None:
+        self.delay = delay
+        self.pending: Dict[int, "asyncio.Task[None]"] = {}
+        self.latest_state: Dict[int, Dict[str, Any]] = {}
+
+    def schedule(self, guild: discord.Guild, t: Dict[str, Any]) -> None:
+        queue_panel_edit(guild, t)
+        self.latest_state[guild.id] = dict(t)
+        if guild.id not in self.pending:
+            task = asyncio.create_task(self._flush(guild), name=f"panel-refresh-{guild.id}")
+            # Nobody awaits this task: surface failures in the log instead of losing them.
+            task.add_done_callback(_log_task_failure)
+            self.pending[guild.id] = task
+
+    async def _flush(self, guild: discord.Guild) -> None:
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.pending.pop(guild.id, None)
 
-    embed = build_tournament_embed(t)
-    await msg.edit(embed=embed)
+        t = self.latest_state.pop(guild.id, None)
+        if t is not None:
+            await refresh_join_panel_message(guild, t)
+
+
+def _log_task_failure(task: "asyncio.Task[Any]") -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        log.error("Background task %s failed", task.get_name(), exc_info=exc)
+
+
+panel_debouncer = PanelRefreshDebouncer()
+
+
+# ---------- Write-behind for tournament settings ----------
+
+# Modals enqueue their upsert and return; one background task writes it off the event
+# loop. Several writes for the same guild queued before a flush collapse to the latest:
+# the queue carries guild ids, the latest data per guild waits in _PENDING_WRITES.
+_WRITE_Q: "asyncio.Queue[int]" = asyncio.Queue()
+_PENDING_WRITES: Dict[int, Tuple[Dict[str, Any], Optional[discord.Interaction]]] = {}
+_writer_task: Optional[asyncio.Task] = None
+
+_UPSERT_FIELDS = ("name", "max_teams", "best_of", "team_size")
+
+
+def queue_tournament_write(
+    guild_id: int,
+    data: Dict[str, Any],
+    interaction: Optional[discord.Interaction] = None,
+) -> None:
+    """Schedule aupsert_tournament(guild_id, data); cached reads see the change right away.
+
+    Only for a row that already exists: the cache patch is a no-op without one.
+    If the write fails, `interaction` (already responded to) gets an ephemeral followup.
+    """
+    patch_cached_tournament(guild_id, {k: data[k] for k in _UPSERT_FIELDS if k in data})
+    _PENDING_WRITES[guild_id] = (dict(data), interaction)
+    _WRITE_Q.put_nowait(guild_id)
+
+
+def drop_queued_tournament_write(guild_id: int) -> None:
+    """Forget this guild's not-yet-written settings (e.g. before deleting its row)."""
+    _PENDING_WRITES.pop(guild_id, None)
+
+
+async def _write_pending(guild_id: int) -> None:
+    pending = _PENDING_WRITES.pop(guild_id, None)
+    if pending is None:
+        return
+    data, interaction = pending
+    try:
+        await aupsert_tournament(guild_id, data)
+    except Exception:
+        log.exception("Guild %s: Deferred tournament upsert failed.", guild_id)
+        if interaction is not None:
+            await _report_failed_write(guild_id, interaction)
+
+
+async def _report_failed_write(guild_id: int, interaction: discord.Interaction) -> None:
+    """Tell the admin the save failed and put the stored settings back on the panel."""
+    try:
+        await interaction.followup.send(
+            "❌ Tournament settings could not be saved. Please try again.",
+            ephemeral=True
+        )
+    except discord.HTTPException:
+        log.warning("Guild %s: Could not report failed settings write.", guild_id)
+
+    # aupsert_tournament dropped the patched cache row; re-read what is really stored.
+    t = await aget_tournament(guild_id)
+    if t and interaction.guild is not None:
+        queue_panel_edit(interaction.guild, t)
+
+
+async def _tournament_writer() -> None:
+    while True:
+        guild_id = await _WRITE_Q.get()
+        await _write_pending(guild_id)
+
+
+async def _flush_tournament_writes() -> None:
+    for guild_id in list(_PENDING_WRITES):
+        await _write_pending(guild_id)
 
 
 # ---------- Modals ----------
 
+# Overwrite templates shared by every tournament's category/channels. Only the
+# role -> overwrite dicts are built per create; these values are never mutated.
+_HIDE = discord.PermissionOverwrite(view_channel=False)
+_READ_ONLY = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=False,
+    read_message_history=True,
+)
+_SPEAK = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    read_message_history=True,
+)
+_BOT = discord.PermissionOverwrite(
+    view_channel=True,
+    manage_channels=True,
+    send_messages=True,
+    read_message_history=True,
+)
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """Parse a non-negative integer modal field; None if it isn't one (no exception path)."""
+    value = value.strip()
+    # isascii() keeps out digits like "²" that isdigit() accepts but int() rejects.
+    return int(value) if value.isascii() and value.isdigit() else None
+
+
 class CreateTournamentModal(Modal, title="Create New Tournament"):
     def __init__(self, cog: "TournamentCog"):
         super().__init__(timeout=None)
@@ -227,8 +393,6 @@ class CreateTournamentModal(Modal, title="Create New Tournament"):
         self.add_item(self.team_size_input)
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
-        from .tournament_db import upsert_tournament  # local import to avoid cycles
-
         guild = interaction.guild
         if not guild:
             await interaction.response.send_message(
@@ -239,29 +403,12 @@ class CreateTournamentModal(Modal, title="Create New Tournament"):
 
         # Validate inputs
         name = self.name_input.value.strip()
-        try:
-            max_teams = int(self.max_teams_input.value.strip())
-        except ValueError:
-            await interaction.response.send_message(
-                "❌ Max Teams must be a number.",
-                ephemeral=True
-            )
-            return
-
-        try:
-            best_of = int(self.best_of_input.value.strip())
-        except ValueError:
-            await interaction.response.send_message(
-                "❌ Best-of must be 1, 3, or 5.",
-                ephemeral=True
-            )
-            return
-
-        try:
-            team_size = int(self.team_size_input.value.strip())
-        except ValueError:
+        max_teams = _parse_int(self.max_teams_input.value)
+        best_of = _parse_int(self.best_of_input.value)
+        team_size = _parse_int(self.team_size_input.value)
+        if None in (max_teams, best_of, team_size):
             await interaction.response.send_message(
-                "❌ Team Size must be a number.",
+                "❌ Max Teams, Best-of, and Team Size must all be numbers.",
                 ephemeral=True
             )
             return
@@ -293,42 +440,26 @@ class CreateTournamentModal(Modal, title="Create New Tournament"):
         player_role_name = f"{name} Player"
         spectator_role_name = f"{name} Spectator"
 
-        player_role = discord.utils.get(guild.roles, name=player_role_name)
-        spectator_role = discord.utils.get(guild.roles, name=spectator_role_name)
+        # One pass over guild.roles instead of a linear utils.get scan per role.
+        roles_by_name = {r.name: r for r in guild.roles}
 
-        if player_role is None:
-            player_role = await guild.create_role(
-                name=player_role_name,
-                mentionable=True,
-                reason="Tournament player role for T0G Tournament Bot"
-            )
+        async def _get_or_create_role(role_name: str, reason: str) -> discord.Role:
+            role = roles_by_name.get(role_name)
+            if role is None:
+                role = await guild.create_role(name=role_name, mentionable=True, reason=reason)
+            return role
 
-        if spectator_role is None:
-            spectator_role = await guild.create_role(
-                name=spectator_role_name,
-                mentionable=True,
-                reason="Tournament spectator role for T0G Tournament Bot"
-            )
+        player_role, spectator_role = await asyncio.gather(
+            _get_or_create_role(player_role_name, "Tournament player role for T0G Tournament Bot"),
+            _get_or_create_role(spectator_role_name, "Tournament spectator role for T0G Tournament Bot"),
+        )
 
         # Base category perms
         base_overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            guild.me: discord.PermissionOverwrite(
-                view_channel=True,
-                manage_channels=True,
-                send_messages=True,
-                read_message_history=True,
-            ),
-            player_role: discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=True,
-                read_message_history=True,
-            ),
-            spectator_role: discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=False,
-                read_message_history=True,
-            ),
+            guild.default_role: _HIDE,
+            guild.me: _BOT,
+            player_role: _SPEAK,
+            spectator_role: _SPEAK,
         }
 
         category = await guild.create_category(
@@ -339,101 +470,94 @@ class CreateTournamentModal(Modal, title="Create New Tournament"):
 
         # Admin channel (hidden from players/spectators)
         admin_overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            guild.me: base_overwrites[guild.me],
-            player_role: discord.PermissionOverwrite(view_channel=False),
-            spectator_role: discord.PermissionOverwrite(view_channel=False),
+            guild.default_role: _HIDE,
+            guild.me: _BOT,
+            player_role: _HIDE,
+            spectator_role: _HIDE,
         }
 
         # Read-only channels
-        read_only_player = discord.PermissionOverwrite(
-            view_channel=True,
-            send_messages=False,
-            read_message_history=True,
-        )
-        read_only_spectator = discord.PermissionOverwrite(
-            view_channel=True,
-            send_messages=False,
-            read_message_history=True,
-        )
-
-        announcements_overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            guild.me: base_overwrites[guild.me],
-            player_role: read_only_player,
-            spectator_role: read_only_spectator,
+        read_only_overwrites = {
+            guild.default_role: _HIDE,
+            guild.me: _BOT,
+            player_role: _READ_ONLY,
+            spectator_role: _READ_ONLY,
         }
-        rules_overwrites = announcements_overwrites
-        create_team_overwrites = announcements_overwrites
-        teams_overwrites = announcements_overwrites
-        bracket_overwrites = announcements_overwrites
-        results_overwrites = announcements_overwrites
 
         # Tournament chat: players & spectators can talk
         chat_overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            guild.me: base_overwrites[guild.me],
-            player_role: discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=True,
-                read_message_history=True,
-            ),
-            spectator_role: discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=True,
-                read_message_history=True,
-            ),
+            guild.default_role: _HIDE,
+            guild.me: _BOT,
+            player_role: _SPEAK,
+            spectator_role: _SPEAK,
         }
 
-        # Create channels
-        admin_channel = await guild.create_text_channel(
-            "🔒│tournament-admin",
-            category=category,
-            overwrites=admin_overwrites
-        )
-        announcements_channel = await guild.create_text_channel(
-            "📢│tournament-announcements",
-            category=category,
-            overwrites=announcements_overwrites
-        )
-        rules_channel = await guild.create_text_channel(
-            "📜│tournament-rules",
-            category=category,
-            overwrites=rules_overwrites
-        )
-        create_team_channel = await guild.create_text_channel(
-            "🏷│create-team",
-            category=category,
-            overwrites=create_team_overwrites
-        )
-        teams_channel = await guild.create_text_channel(
-            "🧾│tournament-teams",
-            category=category,
-            overwrites=teams_overwrites
-        )
-        chat_channel = await guild.create_text_channel(
-            "💬│tournament-chat",
-            category=category,
-            overwrites=chat_overwrites
-        )
-        bracket_channel = await guild.create_text_channel(
-            "🏆│bracket-and-scores",
-            category=category,
-            overwrites=bracket_overwrites
-        )
-        results_channel = await guild.create_text_channel(
-            "🎯│match-results",
-            category=category,
-            overwrites=results_overwrites
+        # Create channels concurrently; explicit positions keep the category ordered
+        # even though the requests finish in any order.
+        channel_specs = [
+            ("🔒│tournament-admin", admin_overwrites),
+            ("📢│tournament-announcements", read_only_overwrites),
+            ("📜│tournament-rules", read_only_overwrites),
+            ("🏷│create-team", read_only_overwrites),
+            ("🧾│tournament-teams", read_only_overwrites),
+            ("💬│tournament-chat", chat_overwrites),
+            ("🏆│bracket-and-scores", read_only_overwrites),
+            ("🎯│match-results", read_only_overwrites),
+        ]
+        results = await asyncio.gather(
+            *(
+                guild.create_text_channel(
+                    channel_name,
+                    category=category,
+                    overwrites=overwrites,
+                    position=position,
+                )
+                for position, (channel_name, overwrites) in enumerate(channel_specs)
+            ),
+            return_exceptions=True,
         )
 
-        # Init per-channel content
-        await init_announcements_channel(announcements_channel)
-        await init_rules_channel(rules_channel)
-        await init_create_team_channel(create_team_channel)
-        await init_teams_channel(teams_channel)
-        await init_bracket_channel(bracket_channel)
-        await init_results_channel(results_channel)
+        channels = []
+        for (channel_name, _), result in zip(channel_specs, results):
+            if isinstance(result, BaseException):
+                log.error("Guild %s: Could not create channel %r: %r", guild.id, channel_name, result)
+                result = None
+            channels.append(result)
+
+        (
+            admin_channel,
+            announcements_channel,
+            rules_channel,
+            create_team_channel,
+            teams_channel,
+            chat_channel,
+            bracket_channel,
+            results_channel,
+        ) = channels
+
+        if admin_channel is None:
+            await interaction.followup.send(
+                "❌ Could not create the tournament admin channel. Check my permissions and try again.",
+                ephemeral=True
+            )
+            return
+
+        # Init per-channel content (each initializer logs its own errors)
+        inits = [
+            ("announcements", announcements_channel),
+            ("rules", rules_channel),
+            ("create_team", create_team_channel),
+            ("teams", teams_channel),
+            ("bracket", bracket_channel),
+            ("results", results_channel),
+        ]
+        results = await asyncio.gather(
+            *(init_channel(kind, channel) for kind, channel in inits if channel is not None),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                log.error("Guild %s: Channel initializer failed: %r", guild.id, result)
 
         data = {
             "name": name,
@@ -455,17 +579,26 @@ class CreateTournamentModal(Modal, title="Create New Tournament"):
             "spectators_joined": 0,
             "join_panel_channel_id": None,
             "join_panel_message_id": None,
-            "teams_channel_id": teams_channel.id,
+            "admin_channel_id": admin_channel.id,
+            "announcements_channel_id": announcements_channel.id if announcements_channel else None,
+            "teams_channel_id": teams_channel.id if teams_channel else None,
+            "rules_channel_id": rules_channel.id if rules_channel else None,
+            "create_team_channel_id": create_team_channel.id if create_team_channel else None,
+            "chat_channel_id": chat_channel.id if chat_channel else None,
+            "bracket_channel_id": bracket_channel.id if bracket_channel else None,
+            "results_channel_id": results_channel.id if results_channel else None,
         }
 
-        upsert_tournament(guild.id, data)
-        log.info("Guild %s: Created/updated tournament %r", guild.id, data["name"])
-
+        # Post the panel first so the row is written once, already holding its message id
+        # (the embed doesn't read panel_message_id).
         embed = build_tournament_embed(data)
         panel_message = await admin_channel.send(embed=embed)
-
         data["panel_message_id"] = panel_message.id
-        upsert_tournament(guild.id, data)
+
+        # First write of a new row: done inline, since the write-behind queue can only
+        # patch a row that is already cached.
+        await aupsert_tournament(guild.id, data)
+        log.info("Guild %s: Created/updated tournament %r", guild.id, data["name"])
 
         await interaction.followup.send(
             f"✅ Tournament **{name}** created.\n"
@@ -520,11 +653,10 @@ class EditTournamentModal(Modal, title="Edit Tournament Settings"):
 
         name = self.name_input.value.strip()
 
-        try:
-            max_teams = int(self.max_teams_input.value.strip())
-            best_of = int(self.best_of_input.value.strip())
-            team_size = int(self.team_size_input.value.strip())
-        except ValueError:
+        max_teams = _parse_int(self.max_teams_input.value)
+        best_of = _parse_int(self.best_of_input.value)
+        team_size = _parse_int(self.team_size_input.value)
+        if None in (max_teams, best_of, team_size):
             await interaction.response.send_message(
                 "❌ Max Teams, Best-of, and Team Size must all be numbers.",
                 ephemeral=True
@@ -560,21 +692,35 @@ class EditTournamentModal(Modal, title="Edit Tournament Settings"):
             )
             return
 
+        # Nothing changed: skip the DB write and both panel edits (message edits are
+        # the expensive, rate-limited part).
+        if (name, max_teams, best_of, team_size) == (
+            t.get("name"), t.get("max_teams"), t.get("best_of"), t.get("team_size")
+        ):
+            await interaction.response.send_message(
+                "ℹ️ No changes to save.",
+                ephemeral=True
+            )
+            return
+
         t["name"] = name
         t["max_teams"] = max_teams
         t["best_of"] = best_of
         t["team_size"] = team_size
 
-        upsert_tournament(guild.id, t)
+        # Respond before queueing, so a failed write can report through a followup.
+        await interaction.response.send_message(
+            "✅ Tournament settings updated.",
+            ephemeral=True
+        )
+
+        queue_tournament_write(guild.id, t, interaction)
         log.info("Guild %s: Tournament settings edited by %s", guild.id, interaction.user)
 
         await update_panel_message(guild, t)
         await refresh_join_panel_message(guild)
 
-        await interaction.response.send_message(
-            "✅ Tournament settings updated.",
-            ephemeral=True
-        )
+
 
 
 class DeleteTournamentModal(Modal, title="Confirm Tournament Deletion"):
@@ -620,9 +766,10 @@ class DeleteTournamentModal(Modal, title="Confirm Tournament Deletion"):
         invite_code = t.get("join_invite_code")
         if invite_code:
             try:
-                invite = await interaction.client.fetch_invite(invite_code)
+                invite = await safe_fetch_invite(interaction.client, invite_code)
                 try:
-                    await invite.delete(reason=f"Tournament deleted by {interaction.user}")
+                    if invite is not None:
+                        await safe_delete_invite(invite, reason=f"Tournament deleted by {interaction.user}")
                     log.info(
                         "Guild %s: Deleted invite %s while deleting tournament",
                         guild.id,
@@ -665,79 +812,100 @@ class DeleteTournamentModal(Modal, title="Confirm Tournament Deletion"):
             ephemeral=True
         )
 
+        reason = f"Tournament deleted by {interaction.user}"
+
+        # Snapshot guild state once; every step below reads these instead of
+        # rescanning guild.text_channels / categories / roles.
+        text_channels = list(guild.text_channels)
+        text_channels_by_name = {c.name: c for c in text_channels}
+        roles = list(guild.roles)
+
+        # Children of every category in one pass (CategoryChannel.channels rescans all
+        # guild channels on each access).
+        children_by_category: Dict[int, list] = {}
+        for ch in guild.channels:
+            if ch.category_id is not None:
+                children_by_category.setdefault(ch.category_id, []).append(ch)
+
+        # Single pass over categories: team-hub categories and match categories.
+        # Normalize: lowercase + remove all whitespace so "Tournament   Teams", emojis, etc all match.
+        tourney_name_norm = (t.get("name") or "").lower().replace(" ", "")
+        teams_categories = []
+        matches_categories = []
+        for cat in guild.categories:
+            norm = "".join(cat.name.lower().split())
+            # Every pattern below needs "team" or "match"; most categories have neither.
+            if "team" not in norm and "match" not in norm:
+                continue
+
+            if "tournamentteams" in norm:
+                teams_categories.append(cat)
+                continue
+            if "match" not in norm:
+                continue
+
+            # legacy / generic detection (old naming, covers "tournamentmatches" too),
+            # else true if this cat name includes the tourney name + "matches"
+            if "tournament" in norm or (
+                tourney_name_norm
+                and "matches" in norm
+                and tourney_name_norm in norm
+            ):
+                matches_categories.append(cat)
+
+        # Collect every target first (deduped by id), then delete concurrently in
+        # three phases: child channels, then their categories, then roles.
+        channels_to_delete = {}
+        categories_to_delete = {}
+
         # 1) Main tournament category
         if isinstance(category, discord.CategoryChannel):
-            for ch in list(category.channels):
-                try:
-                    await ch.delete(reason=f"Tournament deleted by {interaction.user}")
-                except discord.Forbidden:
-                    log.warning("Could not delete channel %s in guild %s", ch.id, guild.id)
-            try:
-                await category.delete(reason=f"Tournament deleted by {interaction.user}")
-            except discord.Forbidden:
-                log.warning("Could not delete category %s in guild %s", category.id, guild.id)
+            for ch in children_by_category.get(category.id, ()):
+                channels_to_delete[ch.id] = ch
+            categories_to_delete[category.id] = category
 
         # 2) Core channels by name (fallback)
         for name in channel_names:
-            ch = discord.utils.get(guild.text_channels, name=name)
+            ch = text_channels_by_name.get(name)
             if ch:
-                try:
-                    await ch.delete(reason=f"Tournament deleted by {interaction.user}")
-                except discord.Forbidden:
-                    log.warning("Could not delete channel %s in guild %s", ch.id, guild.id)
+                channels_to_delete[ch.id] = ch
 
         # 3) ANY "Tournament Teams" category (team hubs)
-        for cat in list(guild.categories):
-            # normalize: lowercase + remove spaces so "Tournament   Teams", emojis, etc all match
-            norm = "".join(cat.name.lower().split())
-            if "tournamentteams" in norm:
-                log.info("Deleting Tournament Teams category %r (%s)", cat.name, cat.id)
-                for ch in list(cat.channels):
-                    try:
-                        await ch.delete(reason=f"Tournament deleted by {interaction.user}")
-                    except discord.Forbidden:
-                        log.warning("Could not delete team channel %s in guild %s", ch.id, guild.id)
-                try:
-                    await cat.delete(reason=f"Tournament deleted by {interaction.user}")
-                except discord.Forbidden:
-                    log.warning("Could not delete teams category %s in guild %s", cat.id, guild.id)
-
         # 4) ANY matches category for this tournament (match channels)
-        tourney_name_norm = (t.get("name") or "").lower().replace(" ", "")
-        for cat in list(guild.categories):
-            norm = "".join(cat.name.lower().split())
-            # true if this cat name includes the tourney name + "matches"
-            is_named_for_this_tourney = (
-                tourney_name_norm
-                and tourney_name_norm in norm
-                and "matches" in norm
-            )
-            # legacy / generic detection (old naming)
-            legacy_match = (
-                "tournamentmatches" in norm
-                or ("tournament" in norm and "match" in norm)
-            )
-            if is_named_for_this_tourney or legacy_match:
-                log.info("Deleting Tournament Matches category %r (%s)", cat.name, cat.id)
-                for ch in list(cat.channels):
-                    try:
-                        await ch.delete(reason=f"Tournament deleted by {interaction.user}")
-                    except discord.Forbidden:
-                        log.warning("Could not delete match channel %s in guild %s", ch.id, guild.id)
-                try:
-                    await cat.delete(reason=f"Tournament deleted by {interaction.user}")
-                except discord.Forbidden:
-                    log.warning("Could not delete matches category %s in guild %s", cat.id, guild.id)
-
-        # 5) Any leftover team-* channels (team hubs)
-        for ch in list(guild.text_channels):
+        for cat in teams_categories + matches_categories:
+            log.info("Deleting tournament category %r (%s)", cat.name, cat.id)
+            for ch in children_by_category.get(cat.id, ()):
+                channels_to_delete[ch.id] = ch
+            categories_to_delete[cat.id] = cat
+
+        # 5) Any leftover team-* channels (team hubs), in whatever category they ended up
+        for ch in text_channels:
             # Old naming (no emoji): "team-xyz"
             # New naming (with emoji): "🛡│team-xyz"
-            if ch.name.startswith("team-") or "team-" in ch.name:
+            if ch.id not in channels_to_delete and "team-" in ch.name:
+                channels_to_delete[ch.id] = ch
+
+        # At most 5 deletes in flight: overlaps round-trips while staying inside
+        # Discord's per-route buckets (discord.py still handles any 429s).
+        sem = asyncio.Semaphore(5)
+
+        async def _delete(obj) -> None:
+            async with sem:
                 try:
-                    await ch.delete(reason=f"Tournament deleted by {interaction.user}")
+                    await obj.delete(reason=reason)
                 except discord.Forbidden:
-                    log.warning("Could not delete team channel %s in guild %s", ch.id, guild.id)
+                    log.warning("Could not delete %s %s in guild %s", type(obj).__name__, obj.id, guild.id)
+                except discord.NotFound:
+                    pass
+
+        async def _delete_all(objs) -> None:
+            results = await asyncio.gather(*(_delete(o) for o in objs), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    log.error("Guild %s: Error while deleting tournament objects: %r", guild.id, result)
+
+        await _delete_all(channels_to_delete.values())
+        await _delete_all(categories_to_delete.values())
 
         # 6) Roles (player + spectator + bot teams + human teams)
         roles_to_delete = set()
@@ -745,34 +913,28 @@ class DeleteTournamentModal(Modal, title="Confirm Tournament Deletion"):
         # Player role (from DB or fallback by name)
         if player_role:
             roles_to_delete.add(player_role)
-        else:
-            tourney_name = t.get("name")
-            if tourney_name:
-                r = discord.utils.get(guild.roles, name=f"{tourney_name} Player")
-                if r:
-                    roles_to_delete.add(r)
+        tourney_name = t.get("name")
+        fallback_player_role_name = f"{tourney_name} Player" if (tourney_name and not player_role) else None
 
         # Spectator role
         if spectator_role:
             roles_to_delete.add(spectator_role)
 
-        # Extra cleanup for: Bot Team roles + human Team | roles
-        for role in guild.roles:
-            # Bot-created test teams
-            if role.name.startswith("Bot Team "):
+        # One pass for: fallback player role + Bot Team roles + human "Team | " roles
+        # ("Team | " roles come from /create-team, e.g. "Team | T0G Demons").
+        for role in roles:
+            if role.name.startswith(("Bot Team ", "Team | ")):
                 roles_to_delete.add(role)
-
-            # Human-created teams from /create-team (e.g. "Team | T0G Demons")
-            if role.name.startswith("Team | "):
+            elif fallback_player_role_name and role.name == fallback_player_role_name:
                 roles_to_delete.add(role)
+                fallback_player_role_name = None
 
-        for role in roles_to_delete:
-            try:
-                await role.delete(reason=f"Tournament deleted by {interaction.user}")
-            except discord.Forbidden:
-                log.warning("Could not delete role %s in guild %s", role.id, guild.id)
+        await _delete_all(roles_to_delete)
 
-        delete_tournament(guild.id)
+        # A queued settings write must not re-insert the row after the delete;
+        # adelete_tournament() also waits for one already being written.
+        drop_queued_tournament_write(guild.id)
+        await adelete_tournament(guild.id)
         log.info("Guild %s: Tournament deleted by %s", guild.id, interaction.user)
 
 
@@ -780,4 +942,16 @@ class DeleteTournamentModal(Modal, title="Confirm Tournament Deletion"):
 
 async def setup(bot: commands.Bot):
     # This module now provides the admin panel helpers & modals (no buttons / no Cog).
+    global _writer_task
+    if _writer_task is None or _writer_task.done():
+        _writer_task = asyncio.create_task(_tournament_writer())
     log.info("tournament_admin_panel module loaded (panel helpers & modals only).")
+
+
+async def teardown(bot: commands.Bot):
+    global _writer_task
+    if _writer_task is not None:
+        _writer_task.cancel()
+        _writer_task = None
+    # Don't drop settings that were queued but not yet written.
+    await _flush_tournament_writes()
@@ -3,17 +3,19 @@
 import io
 import os
 import math
+import functools
 import random
 import logging
 from typing import List, Optional, Dict, Tuple
 
-import sqlite3
 import discord
+import numpy as np
 from discord.ext import commands
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageFilter
 
-from .tournament_db import get_tournament, get_db_connection
+from core.db import get_pooled_connection
+from .tournament_db import get_tournament
 
 log = logging.getLogger(__name__)
 
@@ -41,21 +43,16 @@ def collect_team_names(guild: discord.Guild) -> List[str]:
 
     # --- Primary: use REAL teams table (READY teams only) ---
     try:
-        conn = get_db_connection()
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        cur.execute(
-            """
-            SELECT team_name
-            FROM teams
-            WHERE guild_id = ? AND is_ready = 1
-            ORDER BY team_id ASC
-            """,
-            (guild.id,),
-        )
-        rows = cur.fetchall()
-        conn.close()
+        with get_pooled_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT team_name
+                FROM teams
+                WHERE guild_id = ? AND is_ready = 1
+                ORDER BY team_id ASC
+                """,
+                (guild.id,),
+            ).fetchall()
 
         for row in rows:
             names.append(row["team_name"])
@@ -81,10 +78,11 @@ def collect_team_names(guild: discord.Guild) -> List[str]:
     category = guild.get_channel(cat_id) if cat_id else None
 
     if isinstance(category, discord.CategoryChannel):
+        prefix = "team-"
         for ch in category.text_channels:
-            if ch.name.startswith("team-"):
-                cleaned = ch.name.replace("team-", "").replace("-", " ").title()
-                names.append(cleaned)
+            if ch.name.startswith(prefix):
+                # Slice the prefix off instead of a replace() pass over the whole name.
+                names.append(ch.name[len(prefix):].replace("-", " ").title())
 
     log.info(
         "collect_team_names: fallback found %d team names for guild %s",
@@ -98,6 +96,26 @@ def collect_team_names(guild: discord.Guild) -> List[str]:
 # SHARED SEEDING HELPER
 # -------------------------------------------------
 
+def _seed_permutation(n: int) -> Tuple[int, ...]:
+    # shuffle() only depends on the list length, so Random(1) shuffling range(n) gives
+    # the exact order the old global random.seed(1) + shuffle produced for n names.
+    order = list(range(n))
+    random.Random(1).shuffle(order)
+    return tuple(order)
+
+
+# Bracket sizes are precomputed; other counts are built on demand.
+_PERMS: Dict[int, Tuple[int, ...]] = {n: _seed_permutation(n) for n in (2, 4, 8, 16, 32)}
+
+
+@functools.lru_cache(maxsize=64)
+def _seeded(key: Tuple[int, Tuple[str, ...]]) -> Tuple[str, ...]:
+    # key = (guild_id, READY team names)
+    names = key[1]
+    perm = _PERMS.get(len(names)) or _seed_permutation(len(names))
+    return tuple(names[i] for i in perm)
+
+
 def get_seeded_teams(guild: discord.Guild) -> List[str]:
     """
     Return the READY team list in a deterministic shuffled order.
@@ -108,10 +126,24 @@ def get_seeded_teams(guild: discord.Guild) -> List[str]:
     if not team_names:
         return []
 
-    random.seed(1)  # deterministic
-    seeds = team_names[:]
-    random.shuffle(seeds)
-    return seeds
+    # Keyed by the roster itself, so a roster change is simply a new key.
+    return list(_seeded((guild.id, tuple(team_names))))
+
+
+# -------------------------------------------------
+# FONTS (loaded once; ImageFont objects are read-only)
+# -------------------------------------------------
+
+def _load_font(size: int) -> ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+_FONT_TEAM = _load_font(22)
+_FONT_TITLE = _load_font(80)
+_FONT_SUB = _load_font(40)
 
 
 # -------------------------------------------------
@@ -119,25 +151,65 @@ def get_seeded_teams(guild: discord.Guild) -> List[str]:
 # -------------------------------------------------
 
 def create_tog_background(width: int, height: int) -> Image.Image:
-    base = Image.new("RGBA", (width, height), (5, 5, 8, 255))
+    # RGB throughout: the bracket PNG is opaque, so an alpha channel is never needed.
+    base = Image.new("RGB", (width, height), (5, 5, 8))
 
-    vignette = Image.new("L", (width, height))
-    vpx = vignette.load()
+    # Vignette alpha for every pixel at once (same math as the old per-pixel loop).
     cx, cy = width / 2, height / 2
     max_d = math.hypot(cx, cy)
+    # Open grids broadcast to (height, width) inside hypot; the later steps reuse
+    # that one float32 buffer in place instead of allocating new full-size arrays.
+    ys, xs = np.ogrid[0:height, 0:width]
+    d = np.hypot(
+        xs.astype(np.float32) - np.float32(cx),
+        ys.astype(np.float32) - np.float32(cy),
+    )
+    d /= np.float32(max_d)
+    np.power(d, np.float32(1.8), out=d)
+    d *= np.float32(255)
+    vignette = Image.fromarray(d.astype(np.uint8))
 
-    for y in range(height):
-        for x in range(width):
-            d = math.hypot(x - cx, y - cy) / max_d
-            alpha = int(255 * (d ** 1.8))
-            vpx[x, y] = alpha
-
-    bg_rgb = Image.new("RGBA", (width, height), (0, 0, 0, 255))
-    bg = Image.composite(bg_rgb, base, vignette.point(lambda v: 255 - v))
+    bg_rgb = Image.new("RGB", (width, height), (0, 0, 0))
+    bg = Image.composite(bg_rgb, base, ImageChops.invert(vignette))
 
     return bg
 
 
+LOGO_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "assets", "tog_bot_tournament_logo.png")
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_base_bracket_image(width: int, height: int, logo_mtime: Optional[float]) -> Image.Image:
+    # Start with the dark T0G background
+    img = create_tog_background(width, height)
+
+    # Try to overlay your custom logo from /assets/tog_bot_tournament_logo.png
+    try:
+        bot_logo = Image.open(LOGO_PATH).convert("RGB")
+        # BILINEAR: the logo sits at low opacity behind the bracket, so LANCZOS's
+        # extra taps aren't visible.
+        bot_logo = bot_logo.resize((width, height), Image.Resampling.BILINEAR)
+
+        # Control opacity (0–255). Higher = stronger logo.
+        alpha = 110
+        img = Image.blend(img, bot_logo, alpha / 255)
+
+    except Exception as e:
+        log.warning("Could not load T0G logo background: %s", e)
+
+    return img
+
+
+def _logo_mtime() -> Optional[float]:
+    """Part of the cache keys below, so replacing the logo PNG rebuilds the images."""
+    try:
+        return os.path.getmtime(LOGO_PATH)
+    except OSError:
+        return None
+
+
 def draw_bot_logo_layer(width: int, height: int) -> Image.Image:
     # (kept for compatibility; not used by draw_bracket_image now)
     layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
@@ -153,12 +225,8 @@ def draw_bot_logo_layer(width: int, height: int) -> Image.Image:
         width=8,
     )
 
-    try:
-        font_title = ImageFont.truetype("arial.ttf", 80)
-        font_sub = ImageFont.truetype("arial.ttf", 40)
-    except Exception:
-        font_title = ImageFont.load_default()
-        font_sub = ImageFont.load_default()
+    font_title = _FONT_TITLE
+    font_sub = _FONT_SUB
 
     title = "TOG-BOT"
     sub = "TOURNAMENT"
@@ -187,72 +255,26 @@ def draw_bot_logo_layer(width: int, height: int) -> Image.Image:
 # BRACKET IMAGE GENERATOR
 # -------------------------------------------------
 
-def draw_bracket_image(
-    team_names: List[str],
-    eliminated_slots: Optional[List[Tuple[int, int]]] = None,
-    advancing_by_round: Optional[List[List[Optional[str]]]] = None,
-) -> bytes:
-    """
-    Draw a single-elim bracket image with T0G styling and return PNG bytes.
-
-    - team_names: original seeded team list (Round 1 teams, in bracket order).
-    - eliminated_slots: list of (round_idx, box_idx) tuples indicating which
-      boxes should be X'ed out. round_idx is 0-based (0 = first column).
-    - advancing_by_round: list-of-lists describing which team is in each box:
+_PINK = (255, 0, 120)
+_GOLD = (255, 204, 120)
+_WHITE = (240, 240, 240)
 
-        advancing_by_round[0] = list of teams in Round 1 boxes (same length as team_names)
-        advancing_by_round[1] = list of teams in Round 2 boxes (winners from Round 1)
-        advancing_by_round[2] = list of teams in Round 3 boxes, etc.
+Box = Tuple[int, int, int, int]
 
-      Entries may be None for not-yet-decided slots.
-      If advancing_by_round is None, only Round 1 boxes are labeled
-      using team_names, and later rounds are left blank.
-    """
-    n = len(team_names)
-    if n not in (2, 4, 8, 16, 32):
-        raise ValueError("Team count must be 2, 4, 8, 16, or 32.")
 
-    seeds = team_names[:]  # already seeded order
+@functools.lru_cache(maxsize=8)
+def _build_bracket_skeleton(
+    n: int,
+    img_width: int,
+    img_height: int,
+    logo_mtime: Optional[float],
+) -> Tuple[Image.Image, Tuple[Tuple[Box, ...], ...], Box]:
+    """Background + all box outlines + connectors for an n-team bracket (no text)."""
     num_rounds = int(math.log2(n))
 
-    img_width, img_height = 1800, 900
-
-    # --- NEW BACKGROUND USING YOUR PNG LOGO ---
-    # Start with the dark T0G background
-    img = create_tog_background(img_width, img_height)
-
-    # Try to overlay your custom logo from /assets/tog_bot_tournament_logo.png
-    try:
-        logo_path = os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "assets",
-            "tog_bot_tournament_logo.png",
-        )
-        logo_path = os.path.abspath(logo_path)
-
-        bot_logo = Image.open(logo_path).convert("RGBA")
-        bot_logo = bot_logo.resize((img_width, img_height), Image.LANCZOS)
-
-        # Control opacity (0–255). Higher = stronger logo.
-        alpha = 110
-        bot_logo.putalpha(alpha)
-
-        img = Image.alpha_composite(img, bot_logo)
-
-    except Exception as e:
-        log.warning(f"Could not load T0G logo background: {e}")
-    # --- END OF NEW BACKGROUND CODE ---
-
+    img = _build_base_bracket_image(img_width, img_height, logo_mtime).copy()
     draw = ImageDraw.Draw(img)
 
-    try:
-        font_team = ImageFont.truetype("arial.ttf", 22)
-        font_label = ImageFont.truetype("arial.ttf", 22)
-    except Exception:
-        font_team = ImageFont.load_default()
-        font_label = ImageFont.load_default()
-
     margin_x = 130
     margin_y = 80
     box_height = 46
@@ -262,29 +284,16 @@ def draw_bracket_image(
     col_step = usable_width / (num_rounds + 1)
     box_width = col_step * 0.75
 
-    pink = (255, 0, 120, 255)
-    gold = (255, 204, 120, 255)
-    white = (240, 240, 240, 255)
-
-    boxes_per_round: List[List[tuple]] = []
-
-    # Helper to get the label for a given round/slot
-    def get_label_for(round_idx: int, slot_idx: int) -> Optional[str]:
-        if advancing_by_round and len(advancing_by_round) > round_idx:
-            round_list = advancing_by_round[round_idx]
-            if slot_idx < len(round_list):
-                return round_list[slot_idx]
-        # Fallback for round 0 (first column) if no advancing_by_round given
-        if round_idx == 0 and slot_idx < len(seeds):
-            return seeds[slot_idx]
-        return None
+    pink = _PINK
+    gold = _GOLD
+
+    boxes_per_round: List[List[Box]] = []
 
     # ---------- Round 1 ----------
     gap0 = total_span / n
     col_x = margin_x
     r0_boxes = []
     for i in range(n):
-        name = get_label_for(0, i) or seeds[i]
         cy = margin_y + gap0 * (i + 0.5)
         top = int(cy - box_height / 2)
         bottom = int(cy + box_height / 2)
@@ -293,8 +302,6 @@ def draw_bracket_image(
         r = 18
 
         draw.rounded_rectangle([left, top, right, bottom], r, outline=pink, width=3)
-        if name:
-            draw.text((left + 10, top + 12), name, font=font_team, fill=white)
         r0_boxes.append((left, top, right, bottom))
 
     boxes_per_round.append(r0_boxes)
@@ -316,22 +323,10 @@ def draw_bracket_image(
             rad = 18
 
             draw.rounded_rectangle([left, top, right, bottom], rad, outline=pink, width=3)
-
-            label = get_label_for(r_idx, i)
-            if label:
-                draw.text((left + 10, top + 12), label, font=font_team, fill=white)
-
             round_boxes.append((left, top, right, bottom))
 
         boxes_per_round.append(round_boxes)
 
-    # Figure out champion name if we know it (last column has exactly 1 non-None team)
-    champion_name: Optional[str] = None
-    if advancing_by_round and advancing_by_round[-1]:
-        last_col = advancing_by_round[-1]
-        if len(last_col) == 1 and last_col[0]:
-            champion_name = last_col[0]
-
     # ---------- Champion box ----------
     last_round = boxes_per_round[-1]
     if last_round:
@@ -354,13 +349,6 @@ def draw_bracket_image(
         width=3,
     )
 
-    if champion_name:
-        champ_label = f"Champion: {champion_name}"
-    else:
-        champ_label = "Champion"
-
-    draw.text((champ_left + 22, champ_top + 12), champ_label, font=font_label, fill=white)
-
     champ_cy = (champ_top + champ_bottom) / 2
     draw.line([(champ_right, champ_cy), (champ_right + 60, champ_cy)], fill=gold, width=3)
 
@@ -405,26 +393,119 @@ def draw_bracket_image(
             draw.line([(mid_x, tcy), (mid_x, bcy)], fill=pink, width=3)
             draw.line([(mid_x, champion_y), (champ_left, champion_y)], fill=pink, width=3)
 
+    champ_box = (champ_left, champ_top, champ_right, champ_bottom)
+    return img, tuple(tuple(boxes) for boxes in boxes_per_round), champ_box
+
+
+def draw_bracket_image(
+    team_names: List[str],
+    eliminated_slots: Optional[List[Tuple[int, int]]] = None,
+    advancing_by_round: Optional[List[List[Optional[str]]]] = None,
+) -> bytes:
+    """
+    Draw a single-elim bracket image with T0G styling and return PNG bytes.
+
+    - team_names: original seeded team list (Round 1 teams, in bracket order).
+    - eliminated_slots: list of (round_idx, box_idx) tuples indicating which
+      boxes should be X'ed out. round_idx is 0-based (0 = first column).
+    - advancing_by_round: list-of-lists describing which team is in each box:
+
+        advancing_by_round[0] = list of teams in Round 1 boxes (same length as team_names)
+        advancing_by_round[1] = list of teams in Round 2 boxes (winners from Round 1)
+        advancing_by_round[2] = list of teams in Round 3 boxes, etc.
+
+      Entries may be None for not-yet-decided slots.
+      If advancing_by_round is None, only Round 1 boxes are labeled
+      using team_names, and later rounds are left blank.
+
+    Identical inputs return the cached PNG bytes from the previous render.
+    """
+    n = len(team_names)
+    if n not in (2, 4, 8, 16, 32):
+        raise ValueError("Team count must be 2, 4, 8, 16, or 32.")
+
+    return _render_bracket(
+        tuple(team_names),
+        tuple(sorted(set(eliminated_slots or ()))),
+        tuple(tuple(round_list) for round_list in advancing_by_round) if advancing_by_round else None,
+        _logo_mtime(),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _render_bracket(
+    team_names: Tuple[str, ...],
+    eliminated_slots: Tuple[Tuple[int, int], ...],
+    advancing_by_round: Optional[Tuple[Tuple[Optional[str], ...], ...]],
+    logo_mtime: Optional[float],
+) -> bytes:
+    n = len(team_names)
+    seeds = team_names  # already seeded order
+
+    # Background, every box outline and every connector only depend on the team count,
+    # so they come from a cached skeleton (copied before drawing); only labels and
+    # X's are drawn per render.
+    skeleton, boxes_per_round, champ_box = _build_bracket_skeleton(n, 1800, 900, logo_mtime)
+    img = skeleton.copy()
+    draw = ImageDraw.Draw(img)
+
+    font_team = _FONT_TEAM
+    font_label = _FONT_TEAM
+
+    pink = _PINK
+    white = _WHITE
+
+    # Label rows are looked up once per round rather than per box.
+    labels = advancing_by_round or ()
+
+    # ---------- Box labels (Round 1 falls back to the seeded names) ----------
+    for r_idx, round_boxes in enumerate(boxes_per_round):
+        round_labels = labels[r_idx] if r_idx < len(labels) else ()
+        for i, (left, top, right, bottom) in enumerate(round_boxes):
+            label = round_labels[i] if i < len(round_labels) else None
+            if r_idx == 0:
+                label = label or seeds[i]
+            if label:
+                draw.text((left + 10, top + 12), label, font=font_team, fill=white)
+
+    # Figure out champion name if we know it (last column has exactly 1 non-None team)
+    champion_name: Optional[str] = None
+    if advancing_by_round and advancing_by_round[-1]:
+        last_col = advancing_by_round[-1]
+        if len(last_col) == 1 and last_col[0]:
+            champion_name = last_col[0]
+
+    # ---------- Champion label ----------
+    champ_left, champ_top = champ_box[0], champ_box[1]
+    if champion_name:
+        champ_label = f"Champion: {champion_name}"
+    else:
+        champ_label = "Champion"
+
+    draw.text((champ_left + 22, champ_top + 12), champ_label, font=font_label, fill=white)
+
     # ---------- X out eliminated teams in specific boxes ----------
-    elim_slots = set(eliminated_slots or [])
-    if elim_slots:
-        for round_idx, round_boxes in enumerate(boxes_per_round):
-            for i, (left, top, right, bottom) in enumerate(round_boxes):
-                if (round_idx, i) in elim_slots:
-                    pad = 4
-                    draw.line(
-                        [(left + pad, top + pad), (right - pad, bottom - pad)],
-                        fill=pink,
-                        width=3,
-                    )
-                    draw.line(
-                        [(left + pad, bottom - pad), (right - pad, top + pad)],
-                        fill=pink,
-                        width=3,
-                    )
+    # Walk only the eliminated slots (deduped); slots outside the bracket are ignored.
+    for round_idx, i in eliminated_slots:
+        if not (0 <= round_idx < len(boxes_per_round) and 0 <= i < len(boxes_per_round[round_idx])):
+            continue
+        left, top, right, bottom = boxes_per_round[round_idx][i]
+        pad = 4
+        draw.line(
+            [(left + pad, top + pad), (right - pad, bottom - pad)],
+            fill=pink,
+            width=3,
+        )
+        draw.line(
+            [(left + pad, bottom - pad), (right - pad, top + pad)],
+            fill=pink,
+            width=3,
+        )
 
     buf = io.BytesIO()
-    img.convert("RGB").save(buf, format="PNG")
+    # zlib level 1: several times faster than the default 6 for a slightly larger
+    # file, and the image is a transient attachment.
+    img.save(buf, format="PNG", compress_level=1)
     buf.seek(0)
     return buf.getvalue()
 
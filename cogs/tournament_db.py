@@ -9,8 +9,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 import sqlite3
 import shutil
@@ -163,6 +165,34 @@ CREATE INDEX IF NOT EXISTS idx_action_log_guild_time
 ON action_log(guild_id, created_at);
 """
 
+# Tournament settings the cogs read and write that SCHEMA_SQL's table lacks.
+# Added in place by init_db(), so existing DBs keep their rows.
+_EXTRA_TOURNAMENT_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("max_teams", "INTEGER NOT NULL DEFAULT 8"),
+    ("bracket_type", "TEXT NOT NULL DEFAULT 'Single Elim'"),
+    ("screenshot_proof", "INTEGER NOT NULL DEFAULT 0"),
+    ("queue_status", "TEXT NOT NULL DEFAULT 'CLOSED'"),
+    ("teams_joined", "INTEGER NOT NULL DEFAULT 0"),
+    ("players_joined", "INTEGER NOT NULL DEFAULT 0"),
+    ("spectators_joined", "INTEGER NOT NULL DEFAULT 0"),
+    ("player_role_id", "INTEGER"),
+    ("spectator_role_id", "INTEGER"),
+    ("panel_channel_id", "INTEGER"),
+    ("panel_message_id", "INTEGER"),
+    ("join_panel_channel_id", "INTEGER"),
+    ("join_panel_message_id", "INTEGER"),
+    ("join_invite_code", "TEXT"),
+    ("matches_category_id", "INTEGER"),
+)
+
+
+def _ensure_tournament_columns(conn: sqlite3.Connection) -> None:
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(tournaments)").fetchall()}
+    for column, decl in _EXTRA_TOURNAMENT_COLUMNS:
+        if column not in cols:
+            conn.execute(f"ALTER TABLE tournaments ADD COLUMN {column} {decl}")
+    conn.commit()
+
 
 @with_conn
 def init_db(conn: sqlite3.Connection) -> None:
@@ -194,9 +224,11 @@ def init_db(conn: sqlite3.Connection) -> None:
     # PRAGMA table_info() can read a different DB state than the one we wrote.
     try:
         conn.executescript(SCHEMA_SQL)
-        return
     except sqlite3.OperationalError as e:
         msg = str(e).lower()
+    else:
+        _ensure_tournament_columns(conn)
+        return
 
     # 1) Light migrations for common "missing column" errors
     if "no such column: updated_at" in msg:
@@ -206,6 +238,7 @@ def init_db(conn: sqlite3.Connection) -> None:
         _ensure_column("teams", "updated_at", f"ALTER TABLE teams ADD COLUMN updated_at INTEGER NOT NULL DEFAULT {now}")
         _ensure_column("bracket_matches", "updated_at", f"ALTER TABLE bracket_matches ADD COLUMN updated_at INTEGER NOT NULL DEFAULT {now}")
         conn.executescript(SCHEMA_SQL)
+        _ensure_tournament_columns(conn)
         return
 
     # 2) If the DB is too old / different (missing columns like tournament_id/ready, or missing tables)
@@ -231,6 +264,7 @@ def init_db(conn: sqlite3.Connection) -> None:
         conn2 = core_db.get_db_connection()
         try:
             conn2.executescript(SCHEMA_SQL)
+            _ensure_tournament_columns(conn2)
         finally:
             conn2.close()
         return
@@ -313,24 +347,134 @@ def get_active_tournament(conn: sqlite3.Connection, guild_id: int) -> Optional[D
     return _dict(row)
 
 
-@with_conn
-def get_tournament(conn: sqlite3.Connection, tournament_id: int) -> Optional[Dict[str, Any]]:
+# Tournament rows are read on nearly every command but change rarely, so
+# get_tournament() keeps them in memory. Every writer of tournament settings
+# calls invalidate_tournament(); bumps of `updated_at` alone don't.
+# Only touched from the event-loop thread, so no thread lock; entries are kept
+# in least-recently-used order and the oldest is evicted past the cap.
+_TOURNAMENT_CACHE: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+_TOURNAMENT_CACHE_MAX = 1024
+
+# Per-key locks for the async paths: one disk read per cache miss, and an
+# aupsert_tournament() never interleaves with a load of the same key.
+_TOURNAMENT_LOCKS: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Other cogs' row caches that must follow the same invalidations (see link_tournament_cache).
+_LINKED_CACHES: List[Dict[int, Dict[str, Any]]] = []
+
+
+def link_tournament_cache(cache: Dict[int, Dict[str, Any]]) -> None:
+    """Have invalidate_tournament()/patch_cached_tournament() also apply to `cache`."""
+    if not any(c is cache for c in _LINKED_CACHES):
+        _LINKED_CACHES.append(cache)
+
+
+def invalidate_tournament(key: Optional[int] = None) -> None:
+    """Drop cached tournament rows matching `key` (tournament_id or guild_id); all if None."""
+    for cache in (_TOURNAMENT_CACHE, *_LINKED_CACHES):
+        if key is None:
+            cache.clear()
+            continue
+
+        for k, row in list(cache.items()):
+            if k == key or row.get("tournament_id") == key or row.get("guild_id") == key:
+                cache.pop(k, None)
+
+
+def patch_cached_tournament(key: int, changes: Dict[str, Any]) -> None:
+    """Apply pending `changes` to cached rows matching `key` (tournament_id or guild_id).
+
+    Used by write-behind callers so reads before the flush see the new values.
+    """
+    for cache in (_TOURNAMENT_CACHE, *_LINKED_CACHES):
+        for k, row in cache.items():
+            if k == key or row.get("tournament_id") == key or row.get("guild_id") == key:
+                row.update(changes)
+
+
+def _select_tournament(conn: sqlite3.Connection, tournament_id: int) -> Optional[Dict[str, Any]]:
+    """Uncached read on the caller's connection (for writers already holding one)."""
     return _dict(_fetchone(conn, "SELECT * FROM tournaments WHERE tournament_id = ? LIMIT 1", (tournament_id,)))
 
 
+@with_conn
+def _load_tournament(conn: sqlite3.Connection, tournament_id: int) -> Optional[Dict[str, Any]]:
+    return _select_tournament(conn, tournament_id)
+
+
+def _cached_tournament(key: int) -> Optional[Dict[str, Any]]:
+    row = _TOURNAMENT_CACHE.get(key)
+    if row is not None:
+        _TOURNAMENT_CACHE.move_to_end(key)
+    return row
+
+
+def _cache_tournament(key: int, row: Dict[str, Any]) -> None:
+    _TOURNAMENT_CACHE[key] = row
+    _TOURNAMENT_CACHE.move_to_end(key)
+    if len(_TOURNAMENT_CACHE) > _TOURNAMENT_CACHE_MAX:
+        _TOURNAMENT_CACHE.popitem(last=False)
+
+
+def get_tournament(tournament_id: int) -> Optional[Dict[str, Any]]:
+    row = _cached_tournament(tournament_id)
+    if row is None:
+        row = _load_tournament(tournament_id)
+        if row is None:
+            return None
+        _cache_tournament(tournament_id, row)
+
+    # Callers mutate the dict they get back (toggle cogs), so hand out a copy.
+    return dict(row)
+
+
+async def aget_tournament(tournament_id: int) -> Optional[Dict[str, Any]]:
+    """Async get_tournament(): cache hits return inline, misses read in a worker thread."""
+    row = _cached_tournament(tournament_id)
+    if row is None:
+        async with _TOURNAMENT_LOCKS[tournament_id]:
+            row = _cached_tournament(tournament_id)
+            if row is None:
+                row = await asyncio.to_thread(_load_tournament, tournament_id)
+                if row is None:
+                    return None
+                _cache_tournament(tournament_id, row)
+
+    return dict(row)
+
+
+# Columns that may be set one at a time (names are interpolated into SQL, so whitelist).
+_SETTING_COLUMNS = frozenset({
+    "team_size",
+    "best_of",
+    "join_open",
+    "open_join_mode",
+    "captain_scoring",
+    "screenshots_required",
+    "status",
+    "name",
+    "queue_status",
+})
+
+# field -> UPDATE text, built once per field so the connection's statement cache
+# (keyed by SQL text) reuses the compiled statement.
+_UPDATE_STMT_CACHE: Dict[str, str] = {}
+
+
+def _update_stmt(field: str) -> str:
+    sql = _UPDATE_STMT_CACHE.get(field)
+    if sql is None:
+        if field not in _SETTING_COLUMNS:
+            raise ValueError(f"Invalid tournament setting: {field}")
+        sql = _UPDATE_STMT_CACHE[field] = (
+            f"UPDATE tournaments SET {field} = ?, updated_at = ? WHERE tournament_id = ?"
+        )
+    return sql
+
+
 @with_conn
 def set_tournament_setting(conn: sqlite3.Connection, tournament_id: int, key: str, value: Any) -> None:
-    allowed = {
-        "team_size",
-        "best_of",
-        "join_open",
-        "open_join_mode",
-        "captain_scoring",
-        "screenshots_required",
-        "status",
-        "name",
-    }
-    if key not in allowed:
+    if key not in _SETTING_COLUMNS:
         raise ValueError(f"Invalid tournament setting: {key}")
 
     def _write():
@@ -340,21 +484,50 @@ def set_tournament_setting(conn: sqlite3.Connection, tournament_id: int, key: st
         )
 
     run_db(_write)
+    invalidate_tournament(tournament_id)
+
+
+@with_conn
+def _write_tournament_field(conn: sqlite3.Connection, tournament_id: int, field: str, value: Any) -> None:
+    sql = _update_stmt(field)
+
+    def _write():
+        conn.execute(sql, (value, _now(), tournament_id))
+        conn.commit()
+
+    run_db(_write)
+
+
+async def update_tournament_field(tournament_id: int, field: str, value: Any) -> None:
+    """Set one column instead of rewriting the row through upsert_tournament().
+
+    Cached rows are patched in place, so callers holding `t` need no re-read.
+    """
+    _update_stmt(field)  # reject unknown fields before touching the DB
+    async with _TOURNAMENT_LOCKS[tournament_id]:
+        await asyncio.to_thread(_write_tournament_field, tournament_id, field, value)
+        patch_cached_tournament(tournament_id, {field: value})
+
+
+_CHANNEL_COLUMNS = frozenset({
+    "category_id",
+    "admin_channel_id",
+    "announcements_channel_id",
+    "rules_channel_id",
+    "create_team_channel_id",
+    "teams_channel_id",
+    "chat_channel_id",
+    "bracket_channel_id",
+    "results_channel_id",
+})
+
+# Everything the create flow may hand over for a new row (beyond the core settings).
+_CREATE_COLUMNS = _CHANNEL_COLUMNS | {c for c, _ in _EXTRA_TOURNAMENT_COLUMNS} | {"status", "captain_scoring"}
 
 
 @with_conn
 def update_tournament_channels(conn: sqlite3.Connection, tournament_id: int, **channel_ids: Any) -> None:
-    allowed = {
-        "category_id",
-        "admin_channel_id",
-        "announcements_channel_id",
-        "rules_channel_id",
-        "create_team_channel_id",
-        "teams_channel_id",
-        "chat_channel_id",
-        "bracket_channel_id",
-        "results_channel_id",
-    }
+    allowed = _CHANNEL_COLUMNS
     sets: List[str] = []
     vals: List[Any] = []
 
@@ -376,10 +549,10 @@ def update_tournament_channels(conn: sqlite3.Connection, tournament_id: int, **c
         )
 
     run_db(_write)
+    invalidate_tournament(tournament_id)
 
 
-@with_conn
-def upsert_tournament(conn: sqlite3.Connection, guild_id: int, data: Dict[str, Any]) -> int:
+def upsert_tournament(guild_id: int, data: Dict[str, Any]) -> int:
     """Compatibility wrapper used by the admin panel.
 
     - If an active tournament exists for this guild: update core settings.
@@ -387,48 +560,122 @@ def upsert_tournament(conn: sqlite3.Connection, guild_id: int, data: Dict[str, A
 
     Returns the tournament_id.
     """
+    try:
+        tid, row = _write_tournament_through(guild_id, data)
+    finally:
+        invalidate_tournament(guild_id)
+    if row is not None:
+        _cache_tournament(guild_id, row)
+    return tid
+
+
+async def aupsert_tournament(guild_id: int, data: Dict[str, Any]) -> int:
+    """Async upsert_tournament(): the write runs in a worker thread, the cache is
+    updated back on the event loop."""
+    async with _TOURNAMENT_LOCKS[guild_id]:
+        try:
+            tid, row = await asyncio.to_thread(_write_tournament_through, guild_id, data)
+        finally:
+            invalidate_tournament(guild_id)
+        if row is not None:
+            _cache_tournament(guild_id, row)
+        return tid
+
+
+def _write_tournament_through(guild_id: int, data: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """Write, then re-read the row on the same connection (write-through), so the
+    next get_tournament(guild_id) is a cache hit."""
+    tid = _write_tournament(guild_id, data)
+    return tid, _load_tournament(guild_id)
+
+
+@with_conn
+def _write_tournament(conn: sqlite3.Connection, guild_id: int, data: Dict[str, Any]) -> int:
 
     name = str(data.get("name") or "Tournament").strip() or "Tournament"
     max_teams = int(data.get("max_teams") or 8)
     best_of = int(data.get("best_of") or 3)
     team_size = int(data.get("team_size") or 2)
+    # Channel ids from the create flow, so readers can use guild.get_channel(id)
+    # instead of scanning channels by name.
+    channel_ids = {k: v for k, v in data.items() if k in _CHANNEL_COLUMNS and v}
 
-    def _write():
-        t = get_tournament(conn, guild_id)
-        if not t:
-            return create_tournament(
-                conn,
-                guild_id=guild_id,
-                name=name,
-                max_teams=max_teams,
-                best_of=best_of,
-                team_size=team_size,
-                join_open=True,
-                open_join_mode=True,
+    def _write_columns(tid: int, values: Dict[str, Any]) -> None:
+        if values:
+            cols = ", ".join(f"{k} = ?" for k in values)
+            conn.execute(
+                f"UPDATE tournaments SET {cols} WHERE tournament_id = ?",
+                (*values.values(), tid),
             )
 
+    def _write():
         now = _now()
-        conn.execute(
-            """
-            UPDATE tournaments
-               SET name = ?,
-                   max_teams = ?,
-                   best_of = ?,
-                   team_size = ?,
-                   updated_at = ?
-             WHERE tournament_id = ?
-            """,
-            (name, max_teams, best_of, team_size, now, int(t["tournament_id"])),
-        )
-        return int(t["tournament_id"])
+        _begin(conn)
+        try:
+            t = _select_tournament(conn, guild_id)
+            if not t:
+                # The cogs look rows up by guild id (get_tournament(guild.id)), so the
+                # row this wrapper creates is keyed by it.
+                tid = guild_id
+                conn.execute(
+                    """
+                    INSERT INTO tournaments
+                    (guild_id, tournament_id, name, status, created_at, updated_at,
+                     team_size, best_of, max_teams)
+                    VALUES (?, ?, ?, 'active', ?, ?, ?, ?, ?)
+                    """,
+                    (guild_id, tid, name, now, now, team_size, best_of, max_teams),
+                )
+                # The rest of what the create flow knows: panel/role/channel ids, state.
+                _write_columns(tid, {
+                    k: v for k, v in data.items() if k in _CREATE_COLUMNS and v is not None
+                })
+            else:
+                tid = int(t["tournament_id"])
+                conn.execute(
+                    """
+                    UPDATE tournaments
+                       SET name = ?,
+                           max_teams = ?,
+                           best_of = ?,
+                           team_size = ?,
+                           updated_at = ?
+                     WHERE tournament_id = ?
+                    """,
+                    (name, max_teams, best_of, team_size, now, tid),
+                )
+                _write_columns(tid, channel_ids)
+            _commit(conn)
+            return tid
+        except Exception:
+            _rollback(conn)
+            raise
 
     return run_db(_write)
 
 
-def delete_tournament(conn: sqlite3.Connection, tournament_id: int) -> None:
+def delete_tournament(tournament_id: int) -> None:
     """
     DB-side delete. Discord channel/role deletes are in your bot code.
     """
+    try:
+        _delete_tournament(tournament_id)
+    finally:
+        invalidate_tournament(tournament_id)
+
+
+async def adelete_tournament(tournament_id: int) -> None:
+    """Async delete_tournament(): waits out any aupsert_tournament() of the same key,
+    runs the delete in a worker thread and drops the cached row on the event loop."""
+    async with _TOURNAMENT_LOCKS[tournament_id]:
+        try:
+            await asyncio.to_thread(_delete_tournament, tournament_id)
+        finally:
+            invalidate_tournament(tournament_id)
+
+
+@with_conn
+def _delete_tournament(conn: sqlite3.Connection, tournament_id: int) -> None:
     def _write():
         _begin(conn)
         try:
@@ -542,8 +789,6 @@ def user_team_id(conn: sqlite3.Connection, tournament_id: int, user_id: int) ->
     return int(row["team_id"]) if row else None
 
 
-@with_conn
-
 @with_conn
 def add_team(
     conn: sqlite3.Connection,
@@ -554,7 +799,7 @@ def add_team(
     is_bot_team: bool = False,
 ) -> int:
     """Legacy helper used by older cogs: create a team for the active tournament."""
-    t = get_tournament(conn, guild_id)
+    t = _select_tournament(conn, guild_id)
     if not t:
         raise ValueError("No active tournament for this guild.")
     team_id = create_team(conn, int(t["tournament_id"]), guild_id, name, captain_user_id, bool(is_bot_team))
@@ -7,10 +7,14 @@ This file centralizes the connection settings + retry wrapper used across the bo
 
 from __future__ import annotations
 
+import atexit
+import queue
 import random
 import sqlite3
+import threading
 import time
-from typing import Callable, Optional, TypeVar
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar
 
 from .config import DB_PATH
 
@@ -63,14 +67,89 @@ def get_db_connection() -> sqlite3.Connection:
     return conn
 
 
+# Idle configured connections kept for reuse, so hot read paths don't pay connect +
+# PRAGMA setup each call and keep SQLite's per-connection page cache warm.
+_POOL_SIZE = 4
+_POOL: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=_POOL_SIZE)
+
+
+@contextmanager
+def get_pooled_connection() -> Iterator[sqlite3.Connection]:
+    """Borrow a configured connection; it goes back to the pool (or is closed) on exit."""
+    try:
+        conn = _POOL.get_nowait()
+    except queue.Empty:
+        conn = get_db_connection()
+
+    try:
+        yield conn
+    finally:
+        release_pooled_connection(conn)
+
+
+def release_pooled_connection(conn: sqlite3.Connection) -> None:
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.row_factory = sqlite3.Row
+        _POOL.put_nowait(conn)
+    except (queue.Full, sqlite3.Error):
+        conn.close()
+
+
+# One long-lived connection per thread (event loop + to_thread workers), so
+# with_conn calls skip connect/PRAGMA setup and keep the page cache warm.
+_tls = threading.local()
+_thread_conns: "list[sqlite3.Connection]" = []
+_thread_conns_lock = threading.Lock()
+
+
+def get_thread_connection() -> sqlite3.Connection:
+    """Return this thread's configured connection, creating it on first use."""
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        conn = get_db_connection()
+        _tls.conn = conn
+        with _thread_conns_lock:
+            _thread_conns.append(conn)
+    return conn
+
+
+def _drop_thread_connection(conn: sqlite3.Connection) -> None:
+    if getattr(_tls, "conn", None) is conn:
+        _tls.conn = None
+    with _thread_conns_lock:
+        if conn in _thread_conns:
+            _thread_conns.remove(conn)
+
+
+@atexit.register
+def _close_thread_connections() -> None:
+    with _thread_conns_lock:
+        conns, _thread_conns[:] = list(_thread_conns), []
+    for conn in conns:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
 def with_conn(fn):
-    """Decorator: open/close a DB connection automatically."""
+    """Decorator: pass this thread's DB connection as the first argument."""
 
     def wrapper(*args, **kwargs):
-        conn = get_db_connection()
+        conn = get_thread_connection()
         try:
             return fn(conn, *args, **kwargs)
         finally:
-            conn.close()
+            # Same end state as the old close(): uncommitted work is discarded and
+            # per-call tweaks don't leak into the next caller.
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.row_factory = sqlite3.Row
+            except sqlite3.ProgrammingError:
+                # fn closed it (init_db's rebuild path); reconnect on next use.
+                _drop_thread_connection(conn)
 
     return wrapper
@@ -0,0 +1,104 @@
+"""Async SQLite connection pool (aiosqlite).
+
+Cogs that run DB work inside `async def` handlers should use this pool instead of
+`core.db.get_db_connection()` so queries are awaited rather than blocking the
+event loop. Connections are long-lived, which also keeps SQLite's page cache warm.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+import aiosqlite
+
+from .config import DB_PATH
+
+
+async def configure_connection(conn: aiosqlite.Connection) -> None:
+    """Per-connection setup; mirrors core.db.get_db_connection() plus mmap I/O."""
+    conn.row_factory = aiosqlite.Row
+
+    await conn.execute("PRAGMA journal_mode = WAL;")
+    await conn.execute("PRAGMA synchronous = NORMAL;")
+    await conn.execute("PRAGMA foreign_keys = ON;")
+    await conn.execute("PRAGMA busy_timeout = 30000;")
+    await conn.execute("PRAGMA temp_store = MEMORY;")
+    await conn.execute("PRAGMA cache_size = -20000;")
+    await conn.execute("PRAGMA wal_autocheckpoint = 1000;")
+    await conn.execute("PRAGMA mmap_size = 268435456;")
+
+
+class SQLiteConnectionPool:
+    """Small fixed-size pool of aiosqlite connections."""
+
+    def __init__(
+        self,
+        path: Path = DB_PATH,
+        size: int = 4,
+        configure: Callable[[aiosqlite.Connection], Awaitable[None]] = configure_connection,
+    ) -> None:
+        self.path = path
+        self.size = size
+        self.configure = configure
+        self._idle: "asyncio.Queue[aiosqlite.Connection]" = asyncio.Queue()
+        self._conns: List[aiosqlite.Connection] = []
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self.path, timeout=30)
+        await self.configure(conn)
+        return conn
+
+    async def open(self) -> "SQLiteConnectionPool":
+        for _ in range(self.size):
+            conn = await self._connect()
+            self._conns.append(conn)
+            self._idle.put_nowait(conn)
+        return self
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection; any transaction left open is rolled back on release."""
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            try:
+                if conn.in_transaction:
+                    await conn.rollback()
+            finally:
+                self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        conns, self._conns = self._conns, []
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+
+
+_POOL: Optional[SQLiteConnectionPool] = None
+
+
+async def open_pool(size: int = 4) -> SQLiteConnectionPool:
+    """Open the shared pool once (called from the bot's setup_hook)."""
+    global _POOL
+    if _POOL is None:
+        _POOL = await SQLiteConnectionPool(DB_PATH, size=size).open()
+    return _POOL
+
+
+def get_pool() -> SQLiteConnectionPool:
+    if _POOL is None:
+        raise RuntimeError("DB pool is not open yet (open_pool() runs in setup_hook).")
+    return _POOL
+
+
+async def close_pool() -> None:
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        await pool.close()
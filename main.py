@@ -7,10 +7,17 @@ Cleanup Roadmap v1:
 Behavior: unchanged.
 """
 
+import asyncio
+import hashlib
+import json
+import os
+from typing import Optional
+
 import discord
 from discord.ext import commands
 
-from core.config import ROOT, env  # loads .env once
+from core.config import DATA_DIR, ROOT, env  # loads .env once
+from core.db_pool import close_pool, open_pool
 from core.logging_setup import setup_logging
 
 log = setup_logging("T0G_Tournament_Bot")
@@ -28,6 +35,36 @@ intents.guilds = True
 
 # ---------- Paths ----------
 COGS_DIR = ROOT / "cogs"
+# Fingerprint of the last successfully synced slash-command payload.
+CMD_FINGERPRINT_PATH = DATA_DIR / ".cmd_fingerprint"
+
+# ---------- Extensions ----------
+# Static manifest (no directory scan at startup). Keep in sync when adding a cog:
+# *_cog.py files plus the helper modules that expose setup().
+COGS = (
+    "discord_safe",
+    "join_panel_cog",
+    "t_captain_scoring_cog",
+    "t_close_join_cog",
+    "t_delete_tournament_cog",
+    "t_edit_settings_cog",
+    "t_open_join_cog",
+    "t_screenshot_proof_cog",
+    "t_start_bracket_cog",
+    "t_toggle_bracket_cog",
+    "test_bots_cog",
+    "tournament_admin_panel",
+    "tournament_announcements_cog",
+    "tournament_bracket_cog",
+    "tournament_cog",
+    "tournament_create_team_cog",
+    "tournament_results_cog",
+    "tournament_rules_cog",
+    "tournament_teams_cog",
+)
+# Loaded before the rest: tournament_cog runs init_db(), which other cogs' cog_load
+# migrations (e.g. test_bots_cog) expect to have created the schema.
+FIRST_COGS = ("tournament_cog",)
 
 
 class T0GTournamentBot(commands.Bot):
@@ -37,42 +74,84 @@ class T0GTournamentBot(commands.Bot):
             intents=intents,
             application_id=None,
         )
+        self._sync_task: Optional[asyncio.Task] = None
         log.info("Bot instance created.")
 
     async def setup_hook(self):
         log.info("Running setup_hook...")
 
-        if not COGS_DIR.exists():
-            log.warning("Cogs directory %s does not exist.", COGS_DIR.resolve())
-        else:
-            log.info("Searching for cogs in %s ...", COGS_DIR.resolve())
-
-        # Auto-discover and load cogs inside /cogs
-        # We only load actual extensions (cogs) to avoid loading helper modules.
-        # Convention: files ending with *_cog.py, plus a small allowlist.
-        allow = {"discord_safe.py", "tournament_admin_panel.py"}
-        for path in COGS_DIR.glob("*.py"):
-            if path.name.startswith("_"):
-                continue
-            if (not path.name.endswith("_cog.py")) and (path.name not in allow):
-                continue
-
-            ext_name = f"cogs.{path.stem}"
-            try:
-                await self.load_extension(ext_name)
-                log.info("✅ Loaded cog: %s", ext_name)
-            except Exception as e:
-                log.exception("❌ Failed to load cog: %s - %s", ext_name, e)
-
-        # Sync slash commands
+        # Shared aiosqlite pool; cogs pick it up as `bot.db_pool` in their __init__.
+        self.db_pool = await open_pool()
+
+        log.info("Loading %d cogs from %s ...", len(COGS), COGS_DIR.resolve())
+
+        for name in FIRST_COGS:
+            await self._safe_load(f"cogs.{name}")
+
+        # The rest share no load-time state, so their cog_load work overlaps.
+        await asyncio.gather(
+            *(self._safe_load(f"cogs.{name}") for name in COGS if name not in FIRST_COGS)
+        )
+
+        # Command sync is HTTP-only and doesn't need to hold up the gateway connect:
+        # run it alongside startup instead of before it.
+        self._sync_task = asyncio.create_task(self._sync_commands_bg())
+
+        log.info("setup_hook finished.")
+
+    async def _sync_commands_bg(self) -> None:
+        """Sync slash commands (skipped when the payload matches the last successful sync)."""
         try:
-            log.info("Syncing application (slash) commands globally...")
-            synced = await self.tree.sync()
-            log.info("Slash commands synced. Total commands: %d", len(synced))
+            fingerprint = self._command_fingerprint()
+            if fingerprint == self._read_fingerprint():
+                log.info("Slash commands unchanged since last sync; skipping tree.sync().")
+            else:
+                log.info("Syncing application (slash) commands globally...")
+                synced = await self.tree.sync()
+                log.info("Slash commands synced. Total commands: %d", len(synced))
+                self._write_fingerprint(fingerprint)
         except Exception as e:
             log.exception("Error while syncing application commands: %s", e)
 
-        log.info("setup_hook finished.")
+    async def _safe_load(self, ext_name: str) -> None:
+        try:
+            await self.load_extension(ext_name)
+            log.info("✅ Loaded cog: %s", ext_name)
+        except Exception as e:
+            log.exception("❌ Failed to load cog: %s - %s", ext_name, e)
+
+    def _command_fingerprint(self) -> str:
+        payload = {
+            "application_id": self.application_id,
+            "commands": sorted(
+                (c.to_dict(self.tree) for c in self.tree.get_commands()),
+                key=lambda c: (c.get("type", 1), c["name"]),
+            ),
+        }
+        raw = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(raw).hexdigest()
+
+    @staticmethod
+    def _read_fingerprint() -> Optional[str]:
+        try:
+            return CMD_FINGERPRINT_PATH.read_text().strip()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_fingerprint(fingerprint: str) -> None:
+        tmp = CMD_FINGERPRINT_PATH.with_suffix(".tmp")
+        try:
+            tmp.write_text(fingerprint)
+            os.replace(tmp, CMD_FINGERPRINT_PATH)
+        except OSError:
+            log.warning("Could not store slash command fingerprint at %s", CMD_FINGERPRINT_PATH)
+
+    async def close(self):
+        if self._sync_task is not None and not self._sync_task.done():
+            self._sync_task.cancel()
+        await super().close()
+        await close_pool()
 
     async def on_ready(self):
         log.info("Logged in as %s (ID: %s)", self.user, self.user.id)
@@ -87,7 +166,7 @@ bot = T0GTournamentBot()
 
 @bot.event
 async def on_error(event_method, *args, **kwargs):
-    log.exception(f"Unhandled error in event '{event_method}'", exc_info=True)
+    log.exception("Unhandled error in event '%s'", event_method)
 
 
 @bot.tree.error
@@ -128,4 +207,4 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         log.warning("Bot interrupted with CTRL+C, shutting down...")
     except Exception as e:
-        log.critical(f"Bot crashed with an unhandled exception: {e}", exc_info=True)
+        log.critical("Bot crashed with an unhandled exception: %s", e, exc_info=True)